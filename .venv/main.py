@@ -0,0 +1,393 @@
+import os
+import sys
+import math
+import psutil
+
+try:
+    from pynvml import *
+    gpu_avilable = True
+except ImportError:
+    gpu_avilable = False
+
+from PyQt5.QtCore import *
+from PyQt5.QtGui import *
+from PyQt5.QtWidgets import *
+
+# ----------------IMPORTS FOR TABS ----------------
+from cpu_tab import CpuTab
+from ram_tab import RamTab
+from disk_tab import DiskTab
+from process_tab import ProcessTab
+from scheduling_tab import SchedulingTab
+# ------------------------------------------------------
+
+def cpu_usage():
+    return psutil.cpu_percent(interval=None)
+
+def ram_usage():
+    return psutil.virtual_memory().percent
+
+# Volume shown on the Overview disk dial: the system drive on Windows, the root filesystem elsewhere
+_DISK_PATH = 'C:\\' if os.name == 'nt' else '/'
+
+def disk_usage(drive=_DISK_PATH):
+    return psutil.disk_usage(drive).percent
+
+def get_nvidia_gpu_usage_percent(gpu_index=0):
+    try:
+        if not  gpu_avilable:
+            return 0
+        nvmlInit()
+        count = nvmlDeviceGetCount()
+        if gpu_index >= count:
+            nvmlShutdown()
+            return 0
+        handle = nvmlDeviceGetHandleByIndex(gpu_index)
+        util = nvmlDeviceGetUtilizationRates(handle)
+        nvmlShutdown()
+        return util.gpu  
+    except:
+        return 0
+
+class UsageSampler(QObject):
+    """Reads the Overview figures on its own thread; lives in a QThread via moveToThread."""
+    sampled = pyqtSignal(float, float, float, float)  # cpu, ram, gpu, disk %
+    # Disk usage moves slowly, so it is re-read only every DISK_TICKS samples
+    DISK_TICKS = 5
+
+    def __init__(self):
+        super().__init__()
+        self._tickCount = 0
+        self._diskPercent = 0.0
+        # cpu_percent(interval=None) measures since the previous call; the first call has no
+        # previous one and returns a meaningless 0.0, so take it here rather than on the dial
+        cpu_usage()
+
+    @pyqtSlot()
+    def sample(self):
+        if self._tickCount % self.DISK_TICKS == 0:
+            self._diskPercent = disk_usage(_DISK_PATH)
+        self._tickCount += 1
+        self.sampled.emit(cpu_usage(), ram_usage(), float(get_nvidia_gpu_usage_percent(0)), self._diskPercent)
+
+mainFont = "Conthrax"  #It will automatically take Arial as default if conthrax not installed so dw abt installing it
+
+#The main widget class
+class dial(QWidget):
+   
+    valueChanged = pyqtSignal(float)
+
+    def __init__(self, title="CPU Usage", parent=None):
+        super().__init__(parent)
+        self._value = 0.0
+        self._maxValue = 100.0
+        self.thickness = 25
+        self.margin = 100
+        self.setMinimumSize(500, 600)
+        self.title = title
+        # Pens and font for painting, built once rather than on every animation frame
+        self._trackPen = QPen(QColor(80, 80, 80), self.thickness, cap=Qt.RoundCap)
+        self._activePen = QPen(QColor(255, 255, 255), self.thickness, cap=Qt.RoundCap)
+        self._needlePen = QPen(QColor(255, 0, 0), 3)
+        self._textPen = QPen(QColor(255, 255, 255))
+        self._titleFont = QFont(mainFont, 14, QFont.Bold)
+        self.layoutDial()
+
+    def setValue(self, v):
+        v = max(0.0, min(self._maxValue, float(v)))
+        if v != self._value:
+            self._value = v
+            self.valueChanged.emit(self._value)
+            self.update()
+
+    def getValue(self):
+        return self._value
+
+    value = pyqtProperty(float, getValue, setValue, notify=valueChanged)
+
+    def layoutDial(self):
+        # The arc and needle geometry depends only on the widget size, so it is worked out per resize
+        rect = self.rect()
+        R = min(rect.width(), rect.height()) / 2 - self.margin
+        self._cx = rect.center().x()
+        self._cy = rect.center().y()
+        self._arcRect = QRectF(self._cx - R, self._cy - R, 2 * R, 2 * R)
+        self._needleLength = R - self.thickness / 2 - 5
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.layoutDial()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+
+        cx = self._cx
+        cy = self._cy
+        arcRect = self._arcRect
+        
+        #Might change the degrees here later
+        start_deg = 230
+        total_deg = -210
+        ratio = self._value / float(self._maxValue)
+        active_deg = ratio * total_deg
+
+        painter.setPen(self._trackPen)
+        painter.drawArc(arcRect, int(start_deg * 16), int(total_deg * 16))
+
+        painter.setPen(self._activePen)
+        painter.drawArc(arcRect, int(start_deg * 16), int(active_deg * 16))
+
+        angle = start_deg + active_deg
+        rad = math.radians(angle)
+        leng = self._needleLength
+        start = QPointF(cx, cy)
+        end = QPointF(
+            cx + leng * math.cos(rad),
+            cy - leng * math.sin(rad)
+        )
+        painter.setPen(self._needlePen)
+        painter.drawLine(start, end)
+
+        painter.setPen(self._textPen)
+        painter.setFont(self._titleFont)
+        painter.drawText(cx + 15, cy + 30, self.title)
+
+class window(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("OS Process Visualizer")
+        self.setStyleSheet("background-color: #000000; color: #FFFFFF;")
+
+        wid = QWidget()
+        self.setCentralWidget(wid)
+        layout = QHBoxLayout(wid)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+
+        self.menuf = QWidget()
+        self.menuf.setStyleSheet("background-color: #000000; font-family: Conthrax;")
+        self.menuf.setFixedWidth(280)
+
+        menu = QVBoxLayout(self.menuf)
+        menu.setContentsMargins(0, 0, 0, 0)
+        menu.setSpacing(0)
+
+        head = QLabel("MENU")
+        head.setStyleSheet("color: white; font-size: 26px; padding: 18px;")
+        menu.addWidget(head)
+
+        self.btnOv = QPushButton("Overview")
+        self.btnCPU = QPushButton("CPU")
+        self.btnRAM = QPushButton("RAM")
+        self.btnDisk = QPushButton("Disk")
+        self.btnProcesses = QPushButton("Processes")
+        self.btnSched = QPushButton("Scheduling Algorithm")
+
+        self.tabBtn = [
+            self.btnOv, self.btnCPU, self.btnRAM,
+            self.btnDisk, self.btnProcesses, self.btnSched
+        ]
+
+        # One stylesheet for both states; upTb only flips the "selected" property
+        for btn in self.tabBtn:
+            btn.setProperty("selected", False)
+            btn.setStyleSheet("""
+                QPushButton {
+                    color: #FFFFFF;
+                    font-size: 18px;
+                    text-align: left;
+                    padding: 10px 10px;
+                    border: none;
+                }
+                QPushButton[selected="false"]:hover {
+                    background-color: #3A3A3A;
+                    border-left: 4px solid #00A2FF;
+                }
+                QPushButton[selected="true"] {
+                    background-color: #1A1A1A;
+                    border-left: 4px solid #00A2FF;
+                }
+            """)
+            menu.addWidget(btn)
+
+        menu.addStretch()
+        layout.addWidget(self.menuf)
+
+        sep = QWidget()
+        sep.setFixedWidth(1)
+        sep.setStyleSheet("background-color: #FFFFFF;")
+        layout.addWidget(sep)
+
+        self.stack = QStackedWidget()
+        layout.addWidget(self.stack, stretch=1)
+
+        self.ovWid = QWidget()
+        # One rule for all the dial readouts, parsed once here instead of a stylesheet per label
+        self.ovWid.setStyleSheet('QLabel[role="metric"] { color: white; }')
+        ovLayout = QVBoxLayout(self.ovWid)
+        ovLayout.setContentsMargins(20, 20, 20, 20)
+        ovLayout.setSpacing(20)
+
+        header_layout = QHBoxLayout()
+        title_label = QLabel("OS Process Visualizer")
+        title_label.setAlignment(Qt.AlignVCenter | Qt.AlignLeft)
+        title_font = QFont(mainFont, 40, QFont.Bold)
+        title_label.setFont(title_font)
+        title_label.setStyleSheet("color: white; background-color: transparent;")
+        header_layout.addWidget(title_label)
+        header_layout.addStretch()
+        ovLayout.addLayout(header_layout)
+
+        grid = QGridLayout()
+        self._metricFont = QFont(mainFont, 20, QFont.Bold)
+
+        self.cpuGauge = dial("CPU Usage")
+        self.cpuLabel = QLabel("0.00%")
+        self.setLab(self.cpuLabel)
+        cpuPanel = QWidget()
+        cpuLayout = QVBoxLayout(cpuPanel)
+        cpuLayout.setContentsMargins(0,0,0,0)
+        cpuLayout.setSpacing(5)
+        cpuLayout.addWidget(self.cpuGauge)
+        cpuLayout.addWidget(self.cpuLabel, alignment=Qt.AlignHCenter)
+        grid.addWidget(cpuPanel, 0, 0, alignment=Qt.AlignCenter)
+
+        self.ramGauge = dial("RAM Usage")
+        self.ramLabel = QLabel("0.00%")
+        self.setLab(self.ramLabel)
+        ramPanel = QWidget()
+        ramLayout = QVBoxLayout(ramPanel)
+        ramLayout.setContentsMargins(0,0,0,0)
+        ramLayout.setSpacing(5)
+        ramLayout.addWidget(self.ramGauge)
+        ramLayout.addWidget(self.ramLabel, alignment=Qt.AlignHCenter)
+        grid.addWidget(ramPanel, 0, 1, alignment=Qt.AlignCenter)
+
+        self.gpuGauge = dial("GPU Usage")
+        self.gpuLabel = QLabel("0.00%")
+        self.setLab(self.gpuLabel)
+        gpuPanel = QWidget()
+        gpuLayout = QVBoxLayout(gpuPanel)
+        gpuLayout.setContentsMargins(0,0,0,0)
+        gpuLayout.setSpacing(5)
+        gpuLayout.addWidget(self.gpuGauge)
+        gpuLayout.addWidget(self.gpuLabel, alignment=Qt.AlignHCenter)
+        grid.addWidget(gpuPanel, 1, 0, alignment=Qt.AlignCenter)
+
+        self.diskGauge = dial("Disk Usage (C:)" if os.name == 'nt' else "Disk Usage (/)")
+        self.diskLabel = QLabel("0.00%")
+        self.setLab(self.diskLabel)
+        diskPanel = QWidget()
+        diskLayout = QVBoxLayout(diskPanel)
+        diskLayout.setContentsMargins(0,0,0,0)
+        diskLayout.setSpacing(5)
+        diskLayout.addWidget(self.diskGauge)
+        diskLayout.addWidget(self.diskLabel, alignment=Qt.AlignHCenter)
+        grid.addWidget(diskPanel, 1, 1, alignment=Qt.AlignCenter)
+
+        ovLayout.addLayout(grid, stretch=1)
+        # 1) Overview tab
+        self.stack.addWidget(self.ovWid)
+
+        # 2) CPU tab
+        self.cpuTab = CpuTab(self)
+        self.stack.addWidget(self.cpuTab)
+
+        #3 Gpu Tab removed for now
+
+        # 4) RAM tab
+        self.ramTab = RamTab(self)
+        self.stack.addWidget(self.ramTab)
+
+        # 5) Disk tab
+        self.diskTab = DiskTab(self)
+        self.stack.addWidget(self.diskTab)
+
+        # 6) Processes tab 
+        self.processTab = ProcessTab(self)
+        self.stack.addWidget(self.processTab)
+
+        # 7) Scheduling tab
+        self.schedTab = SchedulingTab(self)
+        self.stack.addWidget(self.schedTab)
+
+        self.cpuGauge.valueChanged.connect(lambda v: self.cpuLabel.setText(f"{v:.2f}%"))
+        self.ramGauge.valueChanged.connect(lambda v: self.ramLabel.setText(f"{v:.2f}%"))
+        self.gpuGauge.valueChanged.connect(lambda v: self.gpuLabel.setText(f"{v:.2f}%"))
+        self.diskGauge.valueChanged.connect(lambda v: self.diskLabel.setText(f"{v:.2f}%"))
+
+        # One animation per dial, kept for the window's lifetime and run as a group;
+        # every sample retargets them instead of starting four new animations
+        self.dialAnims = QParallelAnimationGroup(self)
+        for gauge in (self.cpuGauge, self.ramGauge, self.gpuGauge, self.diskGauge):
+            anim = QPropertyAnimation(gauge, b"value")
+            anim.setDuration(3000)
+            anim.setEasingCurve(QEasingCurve.Linear)
+            self.dialAnims.addAnimation(anim)
+
+        self.currentTab = self.btnOv
+        self.upTb()
+
+        self.btnOv.clicked.connect(lambda: self.showTab(0, self.btnOv))
+        self.btnCPU.clicked.connect(lambda: self.showTab(1, self.btnCPU))
+        self.btnRAM.clicked.connect(lambda: self.showTab(2, self.btnRAM))
+        self.btnDisk.clicked.connect(lambda: self.showTab(3, self.btnDisk))
+        self.btnProcesses.clicked.connect(lambda: self.showTab(4, self.btnProcesses))
+        self.btnSched.clicked.connect(lambda: self.showTab(5, self.btnSched))
+
+        # psutil and NVML reads happen on the sampler's thread; the window only animates the dials
+        self.samplerThread = QThread(self)
+        self.usageSampler = UsageSampler()
+        self.usageSampler.moveToThread(self.samplerThread)
+        self.usageSampler.sampled.connect(self.updateUsages)
+        self.samplerThread.finished.connect(self.usageSampler.deleteLater)
+        self.samplerThread.start()
+        QApplication.instance().aboutToQuit.connect(self.stopSampling)
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(2000)
+        self.timer.timeout.connect(self.usageSampler.sample)
+        self.timer.start()
+
+    def stopSampling(self):
+        if self.samplerThread.isRunning():
+            self.samplerThread.quit()
+            self.samplerThread.wait()
+
+    def setLab(self, label):
+        label.setAlignment(Qt.AlignCenter)
+        label.setFont(self._metricFont)
+        label.setProperty("role", "metric")
+
+    def upTb(self):
+        for btn in self.tabBtn:
+            selected = btn == self.currentTab
+            if btn.property("selected") != selected:
+                btn.setProperty("selected", selected)
+                btn.style().unpolish(btn)
+                btn.style().polish(btn)
+
+    def showTab(self, index, button):
+        self.stack.setCurrentIndex(index)
+        self.currentTab = button
+        self.upTb()
+        if index == 0:  # Overview tab
+            self.timer.start()
+        else:
+            self.timer.stop()
+
+    def updateUsages(self, cpu_val, ram_val, gpu_val, disk_val):
+        # Each dial moves from wherever it is now, so a sample arriving mid-animation stays smooth
+        self.dialAnims.stop()
+        for i, val in enumerate((cpu_val, ram_val, gpu_val, disk_val)):
+            anim = self.dialAnims.animationAt(i)
+            anim.setStartValue(anim.targetObject().value)
+            anim.setEndValue(val)
+        self.dialAnims.start()
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    w = window()
+    w.showMaximized()
+    sys.exit(app.exec_())
@@ -0,0 +1,50 @@
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+class MonitorClock(QObject):
+    """Shared 2 s clock for the monitoring tabs.
+
+    Every sampler wakes on the same timer instead of one timer each. INTERVAL is the
+    subscribers' common period, so no tick is delivered only to be ignored, and the
+    timer only runs while at least one subscriber (a visible tab) is connected.
+    """
+    tick = pyqtSignal(int)
+    INTERVAL = 2000
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """The application-wide clock, created (on the GUI thread) by its first user."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self._count = 0
+        self._slots = set()
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.INTERVAL)
+        self._timer.timeout.connect(self._onTimeout)
+
+    def subscribe(self, slot):
+        """Connect slot to tick, starting the clock for its first subscriber."""
+        if slot in self._slots:
+            return
+        self.tick.connect(slot)
+        self._slots.add(slot)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def unsubscribe(self, slot):
+        """Disconnect slot, stopping the clock once nothing listens."""
+        if slot not in self._slots:
+            return
+        self._slots.discard(slot)
+        self.tick.disconnect(slot)
+        if not self._slots:
+            self._timer.stop()
+
+    def _onTimeout(self):
+        self.tick.emit(self._count)
+        self._count += 1
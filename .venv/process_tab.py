@@ -0,0 +1,1267 @@
+
+import os
+import psutil
+import math
+import time
+from heapq import nlargest
+from functools import lru_cache
+from dataclasses import dataclass, field
+import numpy as np
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
+    QTableView, QHeaderView, QStyleOption, QStyle,
+    QMenu, QMessageBox, QApplication, QStackedLayout
+)
+from PyQt5.QtGui import (
+    QFont, QPainter, QColor, QPen, QBrush, QFontDatabase, QCursor, QPixmap, QPainterPath, QFontMetrics
+)
+from PyQt5.QtCore import (
+    Qt, QTimer, QBasicTimer, QRect, QRectF, QPoint, QThread, QObject, QAbstractTableModel, QModelIndex,
+    pyqtSignal, pyqtSlot
+)
+
+sciFiFontName = "Conthrax"
+
+# Bar colours are built once from integer RGB instead of parsing hex strings on every paint
+_BAR_PEN_COLOR = QColor(0x00, 0x7F, 0xFF)
+_BAR_BRUSH_COLOR = QColor(0x00, 0xA2, 0xFF)
+# Bar graphs fill their own background (the app's black) so Qt can skip erasing behind them
+_GRAPH_BACKGROUND = QColor(0x00, 0x00, 0x00)
+
+# Bar wave: one table entry per 16 ms frame (0.016 rad/frame, as the old waveTime step), and
+# rows are offset by 0.5 rad. Indexing the table replaces math.sin and float phase accumulation.
+_WAVE_STEPS = 393
+_WAVE_LUT = 5 * np.sin(np.arange(_WAVE_STEPS) * (2 * math.pi / _WAVE_STEPS))
+_WAVE_ROW_STEP = 31
+
+# Idle pseudo-processes hidden from the list; on Windows the idle process is always pid 0
+_IDLE_NAMES = frozenset({"system idle process", "idle"})
+_IDLE_PIDS = frozenset({0}) if psutil.WINDOWS else frozenset()
+
+_BYTES_TO_MB = np.float32(1.0 / (1024 * 1024))
+
+# Linux fast path: per-tick cpu and RSS come straight from /proc/<pid>/stat
+_PROCFS = psutil.LINUX
+_CLK_TCK = os.sysconf("SC_CLK_TCK") if _PROCFS else 100
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if _PROCFS else 4096
+# Elsewhere the same two figures come from psutil in one as_dict() call
+_PROC_ATTRS = ("cpu_times",)
+_PROC_ATTRS_RSS = ("cpu_times", "memory_info")
+
+# Cell text per value: most processes repeat last pass's figure (idle ones sit at 0.0%),
+# so formatting is memoized instead of redone for every row of every snapshot
+@lru_cache(maxsize=4096)
+def _cpuText(value):
+    return "%.1f%%" % value
+
+@lru_cache(maxsize=4096)
+def _memText(value):
+    return "%.1fMB" % value
+
+def _readProcStat(pid, withRss):
+    """(user+system cpu seconds, rss bytes, start time) for a pid from a single /proc/<pid>/stat read."""
+    with open(f"/proc/{pid}/stat", "rb") as f:
+        data = f.read()
+    # comm may contain spaces or ')', so split only what follows its closing paren;
+    # utime, stime, starttime and rss are fields 14, 15, 22 and 24, i.e. 11, 12, 19 and 21
+    # counted from state
+    fields = data[data.rfind(b")") + 2:].split()
+    cpuTime = (int(fields[11]) + int(fields[12])) / _CLK_TCK
+    # stat's rss is the same page count statm reports, so no second file is opened
+    rss = int(fields[21]) * _PAGE_SIZE if withRss else 0
+    # starttime (clock ticks since boot) tells a reused pid apart from the process first seen
+    return cpuTime, rss, int(fields[19])
+
+# Cell alignment for the Process / PID / CPU / RAM columns, as plain ints for the model's data();
+# cells use the table's font
+_TABLE_ALIGNMENTS = tuple(int(a) for a in (
+    Qt.AlignVCenter | Qt.AlignLeft, Qt.AlignCenter, Qt.AlignCenter, Qt.AlignCenter
+))
+
+# sortKey -> (ProcessSnapshot column, descending) for the process table
+_SORT_COLUMNS = {
+    "process": ("names", False),
+    "pid": ("pids", False),
+    "cpu": ("cpu", True),
+    "ram": ("mem", True),
+}
+
+
+# --------------------- Process Snapshot ---------------------
+@dataclass(frozen=True)
+class ProcessSnapshot:
+    """One sample of all processes stored as parallel arrays (index i is one process).
+    Frozen: the worker builds it whole and the GUI thread only reads it."""
+    names: list
+    pids: np.ndarray
+    cpu: np.ndarray
+    mem: np.ndarray
+    # Top 10 (name, value) pairs by cpu / mem, filled in by the worker for the bar graphs
+    topCpu: list = field(default_factory=list)
+    topMem: list = field(default_factory=list)
+    # Table cell strings, formatted on the worker thread rather than in the model's data()
+    cpuText: list = field(default_factory=list)
+    memText: list = field(default_factory=list)
+    # Row order for the default cpu-descending sort, argsorted on the worker thread
+    cpuOrder: list = field(default_factory=list)
+    # False when the worker skipped memory_info(); mem is then all zeros and memText empty
+    hasMem: bool = True
+
+    def __len__(self):
+        return len(self.names)
+
+
+# --------------------- Process Table Model ---------------------
+class ProcessTableModel(QAbstractTableModel):
+    """Read-only view of a ProcessSnapshot, showing the text the worker already formatted."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Snapshot columns in display order
+        self._names, self._pids, self._cpuTexts, self._memTexts = [], [], [], []
+
+    def setSnapshot(self, snapshot, sortKey):
+        """Show a snapshot sorted by sortKey; ties keep snapshot order."""
+        column, descending = _SORT_COLUMNS.get(sortKey, _SORT_COLUMNS["cpu"])
+        if column == "cpu" and len(snapshot.cpuOrder) == len(snapshot):
+            order = snapshot.cpuOrder
+        else:
+            keys = np.array(snapshot.names) if column == "names" else getattr(snapshot, column)
+            order = np.argsort(-keys if descending else keys, kind="stable").tolist()
+
+        names, cpuText, memText = snapshot.names, snapshot.cpuText, snapshot.memText
+        columns = (
+            [names[i] for i in order],
+            snapshot.pids[order].tolist(),
+            [cpuText[i] for i in order],
+            [memText[i] for i in order] if memText else [""] * len(order),
+        )
+        # A quiet tick often yields exactly the rows already shown; don't make the view repaint them
+        if columns == (self._names, self._pids, self._cpuTexts, self._memTexts):
+            return
+
+        oldCount, newCount = len(self._pids), len(order)
+        # Rows are only inserted or removed at the end, so the view keeps its scroll position
+        if newCount > oldCount:
+            self.beginInsertRows(QModelIndex(), oldCount, newCount - 1)
+        elif newCount < oldCount:
+            self.beginRemoveRows(QModelIndex(), newCount, oldCount - 1)
+        self._names, self._pids, self._cpuTexts, self._memTexts = columns
+        if newCount > oldCount:
+            self.endInsertRows()
+        elif newCount < oldCount:
+            self.endRemoveRows()
+        if newCount:
+            self.dataChanged.emit(self.index(0, 0), self.index(newCount - 1, 3))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._pids)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 4
+
+    def data(self, index, role=Qt.DisplayRole):
+        row, col = index.row(), index.column()
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return self._names[row]
+            if col == 1:
+                return str(self._pids[row])
+            if col == 2:
+                return self._cpuTexts[row]
+            return self._memTexts[row]
+        if role == Qt.TextAlignmentRole:
+            return _TABLE_ALIGNMENTS[col]
+        # The PID backs the context menu actions
+        if role == Qt.UserRole:
+            return self._pids[row]
+        return None
+
+
+# --------------------- Background Worker for Process Data ---------------------
+class ProcessDataWorker(QObject):
+    """Samples processes on its own thread; lives in a QThread via moveToThread.
+
+    The sampling timer is owned by the worker thread, so pause/resume must be
+    invoked through queued signals, never called directly from the GUI thread.
+    """
+    dataReady = pyqtSignal(object)
+    
+    # Adaptive sampling: back off while the system is quiet, snap back on change or user input.
+    # The base rate follows the view: the animated graphs want fresher data than the table.
+    LIST_INTERVAL = 2000
+    GRAPH_INTERVAL = 750
+    INACTIVE_INTERVAL = 5000  # window on screen but another application has focus
+    MAX_INTERVAL = 10000
+    QUIET_DELTA = 1.0  # summed |cpu% change| across processes that counts as "nothing happened"
+    PRIME_DELAY = 300  # ms between recording cpu-time baselines and the first real sample
+    RSS_REFRESH_PASSES = 10  # psutil path: re-read every RSS once per this many passes
+
+    def __init__(self, interval=LIST_INTERVAL):
+        super().__init__()
+        self.interval = interval
+        self.baseInterval = self.LIST_INTERVAL
+        self._timer = None
+        self._lastSnapshot = None
+        # pid -> psutil.Process, created once per pid when it is first seen
+        self._procCache = {}
+        # pid -> name read once at discovery (None for idle processes we hide)
+        self._procNames = {}
+        # pid -> user+system cpu seconds at the previous pass; cpu% is derived from these
+        # deltas against one wall-clock reading per pass instead of per-process cpu_percent()
+        self._cpuTimes = {}
+        self._sampleTime = None
+        # memory_info() is the costliest per-process read; skip it while no view shows RAM
+        self._needRam = True
+        # pid -> last RSS read through psutil; /proc/<pid>/stat gives RSS for free, so Linux
+        # never fills this. _rssPass counts passes up to the next full RSS refresh
+        self._rss = {}
+        self._rssPass = 0
+        # pid -> /proc/<pid>/stat starttime at discovery; a different value means the pid was
+        # reused. Elsewhere the cached Process already holds its create_time() for is_running()
+        self._startTimes = {}
+
+    @pyqtSlot()
+    def resume(self):
+        if self._timer is None:
+            self._timer = QTimer(self)
+            self._timer.setInterval(self.interval)
+            self._timer.timeout.connect(self.sample)
+        if not self._timer.isActive():
+            if not self._procCache:
+                # First run: no process has a cpu-time baseline yet, so record them
+                # all now and take the first real sample once a short delta has accrued
+                self._sampleProcesses()
+                QTimer.singleShot(self.PRIME_DELAY, self.sample)
+            else:
+                self.sample()
+            self._timer.start()
+
+    @pyqtSlot()
+    def pause(self):
+        if self._timer is not None:
+            self._timer.stop()
+
+    @pyqtSlot()
+    def boost(self):
+        """User interacted: go back to the fastest interval."""
+        self._setInterval(self.baseInterval)
+
+    @pyqtSlot(int)
+    def setBaseInterval(self, interval):
+        """The visible view changed; sample at its rate (this also ends any back-off)."""
+        self.baseInterval = interval
+        self._setInterval(interval)
+
+    def clearCache(self):
+        """Release every cached psutil.Process handle and name."""
+        self._procCache.clear()
+        self._procNames.clear()
+        self._cpuTimes.clear()
+        self._rss.clear()
+        self._startTimes.clear()
+        self._sampleTime = None
+        self._lastSnapshot = None
+
+    @pyqtSlot(bool)
+    def setNeedRam(self, needRam):
+        wasNeeded, self._needRam = self._needRam, needRam
+        if needRam and not wasNeeded:
+            self._rssPass = 0  # cached RSS went stale while no view needed it
+        # A view that shows RAM just appeared: give it memory figures now, not next tick
+        if needRam and not wasNeeded and self._timer is not None and self._timer.isActive():
+            self.sample()
+
+    @pyqtSlot()
+    def sample(self):
+        try:
+            snapshot = self._sampleProcesses()
+            self.dataReady.emit(snapshot)
+            self._adaptInterval(snapshot)
+        except Exception as e:
+            print(f"Error in process data worker: {e}")
+
+    def _adaptInterval(self, snapshot):
+        last, self._lastSnapshot = self._lastSnapshot, snapshot
+        if last is None:
+            return
+        _, newIdx, oldIdx = np.intersect1d(snapshot.pids, last.pids, assume_unique=True, return_indices=True)
+        delta = float(np.abs(snapshot.cpu[newIdx] - last.cpu[oldIdx]).sum())
+        if delta < self.QUIET_DELTA and len(snapshot) == len(last):
+            self._setInterval(min(self.interval * 2, self.MAX_INTERVAL))
+        else:
+            self._setInterval(self.baseInterval)
+
+    def _setInterval(self, interval):
+        if interval == self.interval:
+            return
+        self.interval = interval
+        if self._timer is not None:
+            self._timer.setInterval(interval)
+
+    def _sampleProcesses(self):
+        """One pass over all processes, feeding both the table and the graphs."""
+        pidList = psutil.pids()
+        pidSet = set(pidList)
+
+        # Forget processes that have exited since the last pass
+        for pID in self._procCache.keys() - pidSet:
+            self._forget(pID)
+
+        now = time.monotonic()
+        elapsed = now - self._sampleTime if self._sampleTime is not None else 0.0
+        self._sampleTime = now
+
+        fresh = set()
+        # Only newly seen pids pay for a Process handle and a name lookup;
+        # idle processes are remembered with a None name so they are skipped cheaply.
+        # A pid whose cpu times are denied is cached too, with a None cpu time: it is
+        # listed at 0.0% (as process_iter reported it) and never read again.
+        for pID in pidSet - self._procCache.keys():
+            if pID in _IDLE_PIDS:
+                continue
+            try:
+                proc = psutil.Process(pID)
+                try:
+                    pName = proc.name() or "Unknown"
+                except psutil.AccessDenied:
+                    pName = "Unknown"
+                try:
+                    if _PROCFS:
+                        cpuTime, _, self._startTimes[pID] = _readProcStat(pID, False)
+                    else:
+                        times = proc.cpu_times()
+                        cpuTime = times.user + times.system
+                except (psutil.AccessDenied, PermissionError):
+                    cpuTime = None
+            except (psutil.NoSuchProcess, FileNotFoundError, ProcessLookupError):
+                continue
+            fresh.add(pID)
+            self._procCache[pID] = proc
+            self._cpuTimes[pID] = cpuTime
+            self._procNames[pID] = None if pName.lower() in _IDLE_NAMES else pName
+
+        needRam = self._needRam
+        refreshRss = needRam and self._rssPass == 0
+        if needRam:
+            self._rssPass = (self._rssPass + 1) % self.RSS_REFRESH_PASSES
+        names, pids, cpus, mems = [], [], [], []
+        # A reused pid is dropped like an exited one and discovered afresh next pass,
+        # so no name, cpu-time baseline, handle or RSS carries over to the new process
+        for pID in pidList:
+            if pID not in self._procCache:
+                continue
+            pName = self._procNames[pID]
+            if pName is None or self._cpuTimes[pID] is None:
+                # Never read per pass, so only the handle's pid + create_time() can show reuse
+                if not self._procCache[pID].is_running():
+                    self._forget(pID)
+                    continue
+                if pName is None:
+                    continue
+                names.append(pName)
+                pids.append(pID)
+                cpus.append(0.0)
+                mems.append(0)
+                continue
+            try:
+                if _PROCFS:
+                    cpuTime, rss, startTime = _readProcStat(pID, needRam)
+                    if startTime != self._startTimes[pID]:
+                        raise ProcessLookupError(pID)  # reused: forgotten below like an exit
+                else:
+                    if not self._procCache[pID].is_running():
+                        raise psutil.NoSuchProcess(pID)
+                    # Between full refreshes only pids without a cached RSS read memory_info()
+                    withRss = needRam and (refreshRss or pID not in self._rss)
+                    cpuTime, rss = self._readProcess(self._procCache[pID], withRss)
+                    if withRss:
+                        self._rss[pID] = rss
+                    elif needRam:
+                        rss = self._rss[pID]
+            except (psutil.NoSuchProcess, FileNotFoundError, ProcessLookupError):
+                self._forget(pID)
+                continue
+            except (psutil.AccessDenied, PermissionError):
+                # Denied from now on: keep listing it at 0.0% without reading it again
+                self._cpuTimes[pID] = None
+                self._rss.pop(pID, None)
+                names.append(pName)
+                pids.append(pID)
+                cpus.append(0.0)
+                mems.append(0)
+                continue
+            # A pid first seen in this pass has no meaningful delta yet
+            if pID in fresh or elapsed <= 0.0:
+                pCPU = 0.0
+            else:
+                # Same figure cpu_percent() reports: 100% is one fully busy core
+                pCPU = round(max(cpuTime - self._cpuTimes[pID], 0.0) / elapsed * 100, 1)
+            self._cpuTimes[pID] = cpuTime
+
+            names.append(pName)
+            pids.append(pID)
+            cpus.append(pCPU)
+            mems.append(rss)
+
+        cpuArray = np.array(cpus, dtype=np.float32)
+        # bytes -> MB for the whole snapshot in one vectorized multiply
+        memArray = np.array(mems, dtype=np.float32) * _BYTES_TO_MB
+        # Cell text and graph top-10s are prepared here so the GUI thread only has to draw them
+        cpuValues = cpuArray.tolist()
+        memValues = memArray.tolist() if needRam else []
+        return ProcessSnapshot(
+            names,
+            np.array(pids, dtype=np.int64),
+            cpuArray,
+            memArray,
+            topCpu=self._topTen(names, cpuValues),
+            topMem=self._topTen(names, memValues) if needRam else [],
+            cpuText=list(map(_cpuText, cpuValues)),
+            memText=list(map(_memText, memValues)),
+            cpuOrder=np.argsort(-cpuArray, kind="stable").tolist(),
+            hasMem=needRam,
+        )
+
+    def _forget(self, pID):
+        """Drop everything cached for a pid that exited or was reused."""
+        self._procCache.pop(pID, None)
+        self._procNames.pop(pID, None)
+        self._cpuTimes.pop(pID, None)
+        self._rss.pop(pID, None)
+        self._startTimes.pop(pID, None)
+
+    @staticmethod
+    def _readProcess(proc, withRss):
+        """Portable counterpart of _readProcStat through a cached psutil.Process."""
+        # as_dict() reads every attribute inside one oneshot() and turns AccessDenied into None
+        info = proc.as_dict(_PROC_ATTRS_RSS if withRss else _PROC_ATTRS, ad_value=None)
+        times = info["cpu_times"]
+        if times is None:
+            raise psutil.AccessDenied(proc.pid)
+        mem = info.get("memory_info")
+        return times.user + times.system, mem.rss if mem is not None else 0
+
+    @staticmethod
+    def _topTen(names, values):
+        # nlargest keeps first-seen order on ties, so zero-usage bars don't reshuffle
+        order = nlargest(10, range(len(values)), key=values.__getitem__)
+        return [(names[i], values[i]) for i in order]
+
+
+# --------------------- Animated Bar Graph Widgets ---------------------
+class BarGraphWidget(QWidget):
+    """Animated top-10 bar graph; subclasses only choose how a usage value is printed."""
+    USAGE_FORMAT = "%.1f"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Data for animation
+        self.oldData = []  # List of (name, usage, position)
+        self.newData = []  # List of (name, usage, position)
+        self.animFrac = 1.0  # Animation fraction (0 to 1)
+        self.animationActive = False
+        
+        # Animation parameters - reduced for better performance
+        self.ANIM_DURATION = 500  # Reduced from 1000ms to 500ms
+        self.FPS_INTERVAL = 16  # ~30 FPS (reduced from 60 FPS)
+        self._waveIdx = 0  # Frame counter into _WAVE_LUT
+        
+        # Transition states
+        self.transitions = {}  # {name: {'startPos': int, 'endPos': int, 'zScale': float, 'currentPos': float}}
+        
+        # Timer - only runs while an animation is in progress and the widget is shown.
+        # A QBasicTimer delivers straight to timerEvent, skipping the timeout signal hop.
+        self.animTimer = QBasicTimer()
+        
+        self.setMinimumSize(400, 300)
+        # paintEvent covers every pixel, so the parent's background is never drawn underneath
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+
+        # Paint resources are built once and reused by every paintEvent
+        self._barPen = QPen(_BAR_PEN_COLOR, 1.0)
+        self._barBrush = QBrush(_BAR_BRUSH_COLOR)
+        self._labelFont = QFont("Arial", 12)
+        self._labelMetrics = QFontMetrics(self._labelFont)
+        # Label strings and scale are derived in setData, not per frame
+        self._labels = {}
+        self._usageText = {}
+        self._usageMax = 1.0
+        self._prepareRows()
+        self._textWidth = 0
+        self._updateBarsRect()
+        # Off-screen copy of the last rendered frame; None means it must be redrawn
+        self._cache = None
+        # (xOffset, per-bar draw list) for the current frame, laid out by _layoutBars
+        self._frameGeom = None
+        
+        # Performance optimization: track if widget is visible
+        self.isVisible = False
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.isVisible = True
+        if self.animationActive:
+            self.animTimer.start(self.FPS_INTERVAL, self)
+    
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.isVisible = False
+        # Stop the frame timer entirely instead of letting it wake up for nothing
+        self.animTimer.stop()
+
+    def setData(self, data):
+        """Update graph data and prepare animations.
+           data should be a list of tuples: (name, usage)
+        """
+        # Skip if not visible
+        if not self.isVisible:
+            return
+            
+        newData = [(name, usage, i) for i, (name, usage) in enumerate(data[:10])]
+        # Nothing moved and nothing changed: no animation, no repaint
+        if newData == self.newData and not self.animationActive:
+            return
+
+        if not self.oldData:
+            self.oldData = newData
+        self.newData = newData
+        self._labels = {name: (name[:7] + "...") if len(name) > 7 else name for name, _, _ in newData}
+        self._usageText = {name: self.USAGE_FORMAT % usage for name, usage, _ in newData}
+        # Outgoing labels are still on screen while the tween runs, so keep their width too
+        self._updateBarsRect(self._textWidth)
+        self._updateUsageMax()
+        self._prepareRows()
+        self._cache = None
+        self._frameGeom = None
+        
+        # Detect position changes
+        self.transitions = {}
+        for old in self.oldData:
+            oldName, oldUsage, oldPos = old
+            for new in self.newData:
+                newName, newUsage, newPos = new
+                if oldName == newName and oldPos != newPos:
+                    # Determine z-scale: moving down shrinks, moving up grows
+                    zScale = 0.8 if newPos > oldPos else 1.2
+                    self.transitions[oldName] = {
+                        'startPos': oldPos,
+                        'endPos': newPos,
+                        'zScale': zScale,
+                        'currentPos': oldPos
+                    }
+        
+        # Usage values are tweened even when no bar changes position, so every
+        # new data set starts an animation; the timer stops again once it finishes.
+        self.animFrac = 0.0
+        self.animationActive = True
+        self.animTimer.start(self.FPS_INTERVAL, self)
+
+    def timerEvent(self, event):
+        if event.timerId() == self.animTimer.timerId():
+            self.onAnimFrame()
+        else:
+            super().timerEvent(event)
+
+    def onAnimFrame(self):
+        """Update animation state."""
+        self._waveIdx = (self._waveIdx + 1) % _WAVE_STEPS
+        
+        if self.animationActive:
+            self.animFrac += self.FPS_INTERVAL / self.ANIM_DURATION
+            if self.animFrac >= 1.0:
+                self.animFrac = 1.0
+                self.animationActive = False
+                self.oldData = self.newData[:]
+                self.transitions.clear()
+                self._updateUsageMax()
+                self._prepareRows()
+                self._updateBarsRect()
+                self.animTimer.stop()
+            else:
+                for trans in self.transitions.values():
+                    trans['currentPos'] = self.easeInOutQuad(
+                        self.animFrac, trans['startPos'], trans['endPos'] - trans['startPos'], 1.0
+                    )
+            # All frame math happens here, in the timer tick; paintEvent only draws
+            self._layoutBars()
+            self._cache = None
+            self.update(self._barsRect)
+
+    def _updateUsageMax(self):
+        """Scale bars against the largest value on screen (never zero)."""
+        self._usageMax = max([u for (_, u, _) in self.oldData + self.newData], default=0) or 1.0
+
+    def _updateBarsRect(self, textWidth=0):
+        """Area an animation frame can change: names, the longest z-scaled bar and its label."""
+        widths = [self._labelMetrics.horizontalAdvance(text) for text in self._usageText.values()]
+        self._textWidth = max(widths + [textWidth])
+        w = self.width()
+        # Bars span at most 80% of the plot width, grown by the 1.2 z-scale of a rising bar
+        right = int(150 + (w - 150 - 20) * 0.8 * 1.2 + 5 + self._textWidth) + 2
+        self._barsRect = QRect(0, 0, min(w, right), self.height())
+
+    def _prepareRows(self):
+        """Snapshot per-row names and old/new usages as arrays for _renderBars."""
+        dataCount = max(len(self.newData), len(self.oldData))
+        self._rowNames = [name for name, _, _ in self.newData] + [""] * (dataCount - len(self.newData))
+        self._rowPos = np.arange(dataCount, dtype=np.float64)
+        self._rowWave = np.arange(dataCount) * _WAVE_ROW_STEP
+        self._oldUsages = np.zeros(dataCount)
+        self._oldUsages[:len(self.oldData)] = [u for _, u, _ in self.oldData]
+        self._newUsages = np.zeros(dataCount)
+        self._newUsages[:len(self.newData)] = [u for _, u, _ in self.newData]
+        self._usageDeltas = self._newUsages - self._oldUsages
+        # Per-frame scratch arrays, reused by every _renderBars call of this data set
+        self._frameUsages = np.empty(dataCount)
+        self._frameLens = np.empty(dataCount)
+
+    def easeInOutQuad(self, t, b, c, d):
+        """Easing function for smooth animation."""
+        t /= d / 2
+        if t < 1:
+            return c / 2 * t * t + b
+        t -= 1
+        return -c / 2 * (t * (t - 2) - 1) + b
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._cache = None
+        self._frameGeom = None
+        self._updateBarsRect(self._textWidth)
+
+    def paintEvent(self, event):
+        """Blit the cached frame, re-rendering it only when it is stale."""
+        if not self.isVisible:
+            return
+        if not self.oldData and not self.newData:
+            QPainter(self).fillRect(event.rect(), _GRAPH_BACKGROUND)
+            return
+
+        dpr = self.devicePixelRatioF()
+        if self._cache is None or self._cache.size() != self.size() * dpr:
+            self._cache = QPixmap(self.size() * dpr)
+            self._cache.setDevicePixelRatio(dpr)
+            self._cache.fill(_GRAPH_BACKGROUND)
+            cachePainter = QPainter(self._cache)
+            self._renderBars(cachePainter)
+            cachePainter.end()
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._cache)
+
+    def _layoutBars(self):
+        """Compute this frame's bar geometry and labels into self._frameGeom."""
+        rect = self.rect()
+        w, h = rect.width(), rect.height()
+        
+        dataCount = max(len(self.newData), len(self.oldData))
+        if dataCount == 0:
+            self._frameGeom = (0, [])
+            return
+        
+        # Layout
+        barSpacing = 10
+        totalSpacing = (dataCount + 1) * barSpacing
+        barHeight = (h - totalSpacing) / dataCount
+        xOffset = 150  # Space for names
+        rightMargin = 20
+        
+        # Per-frame invariants: row pitch and usage -> pixels (max usage is cached by setData)
+        rowStep = barHeight + barSpacing
+        lenScale = (w - xOffset - rightMargin) * 0.8 / self._usageMax
+        
+        # Tween and lay out every row at once; only moving rows need per-name work
+        usages = np.multiply(self._usageDeltas, self.animFrac, out=self._frameUsages)
+        usages += self._oldUsages
+        positions = self._rowPos.copy()
+        zScales = np.ones(dataCount)
+        for i, name in enumerate(self._rowNames):
+            trans = self.transitions.get(name)
+            if trans is not None:
+                positions[i] = trans['currentPos']
+                zScales[i] = 1.0 + (trans['zScale'] - 1.0) * self.animFrac
+        
+        topYs = barSpacing + positions * rowStep + _WAVE_LUT[(self._waveIdx + self._rowWave) % _WAVE_STEPS]
+        displayLens = np.multiply(usages, lenScale, out=self._frameLens)
+        displayLens *= zScales
+        scaledHeights = barHeight * zScales
+        textYs = (topYs + scaledHeights * 0.7).astype(int)
+        
+        # Larger bars are drawn first; a stable sort keeps row order among equals
+        order = np.argsort(-zScales, kind="stable")
+        # Rows whose value isn't moving reuse setData's string; only tweening values are formatted
+        usageTexts = [
+            text if delta == 0.0 and text is not None else self.USAGE_FORMAT % usage
+            for text, delta, usage in zip(
+                map(self._usageText.get, self._rowNames), self._usageDeltas.tolist(), usages.tolist())
+        ]
+        renderList = list(zip(
+            [self._rowNames[i] for i in order], [usageTexts[i] for i in order], topYs[order].tolist(),
+            displayLens[order].tolist(), scaledHeights[order].tolist(), zScales[order].tolist(),
+            textYs[order].tolist()))
+        self._frameGeom = (xOffset, renderList)
+
+    def _renderBars(self, painter):
+        """Render the bar graph with z-axis animation."""
+        if self._frameGeom is None:
+            self._layoutBars()
+        xOffset, renderList = self._frameGeom
+        if not renderList:
+            return
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        
+        # Bar pass: pen and brush are the same for every bar, so set them once
+        painter.setPen(self._barPen)
+        painter.setBrush(self._barBrush)
+        if self.transitions:
+            # Rows are passing each other and may overlap: draw bar by bar in the z order
+            # _layoutBars chose, so each bar's fill covers the outline of those under it
+            for name, usageText, topY, displayLen, scaledHeight, zScale, textY in renderList:
+                painter.drawRoundedRect(QRectF(xOffset, topY, displayLen, scaledHeight), 5, 5)
+        else:
+            # Nothing moves, so no bars overlap: one drawPath call instead of one call per bar
+            barsPath = QPainterPath()
+            for name, usageText, topY, displayLen, scaledHeight, zScale, textY in renderList:
+                barsPath.addRoundedRect(QRectF(xOffset, topY, displayLen, scaledHeight), 5, 5)
+            painter.drawPath(barsPath)
+        
+        # Text pass: draw name and usage for every bar with a single pen/font change
+        painter.setPen(Qt.white)
+        painter.setFont(self._labelFont)
+        for name, usageText, topY, displayLen, scaledHeight, zScale, textY in renderList:
+            painter.drawText(QPoint(10, textY), self._labels.get(name, name))
+            painter.drawText(int(xOffset + displayLen + 5), textY, usageText)
+
+class CPUBarGraphWidget(BarGraphWidget):
+    """Usage values are CPU percent."""
+    USAGE_FORMAT = "%.1f%%"
+
+
+class RAMBarGraphWidget(BarGraphWidget):
+    """Usage values are RAM in MB."""
+    USAGE_FORMAT = "%.1fMB"
+
+# --------------------- Modifications in ProcessTab ---------------------
+class ProcessTab(QWidget):
+    """
+    The 'Process' tab has two sub-sub-tabs: 'List' and 'Graph'.
+    'List' displays a table of processes with columns [Process Name, PID, CPU%, RAM(MB)].
+    'Graph' displays buttons 'CPU' and 'RAM' to show corresponding sideways bar graphs.
+    """
+    # Queued into the worker thread, which owns the sampling timer
+    resumeSampling = pyqtSignal()
+    pauseSampling = pyqtSignal()
+    userActivity = pyqtSignal()
+    ramNeeded = pyqtSignal(bool)
+    samplingInterval = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.currentSubTab = None
+        self.isVisible = False
+        self.processData = None  # Latest ProcessSnapshot
+        # The table is re-sorted at most once per snapshot and sort key
+        self._tableSnapshot = None  # snapshot and sort key the table currently shows
+        self._tableSortKey = None
+        self.lastUpdateTime = 0
+        self.updatePending = False
+        # Mirror what the worker was last told; see syncSamplingMode
+        self._needRam = True
+        self._samplingInterval = ProcessDataWorker.LIST_INTERVAL
+        self._appActive = QApplication.applicationState() == Qt.ApplicationActive
+        self.pauseUpdates = False  # Flag to pause UI updates when context menu is active or Ctrl is held.
+        
+        # Sampling runs on its own thread; the worker starts paused until showEvent
+        self.workerThread = QThread(self)
+        self.dataWorker = ProcessDataWorker()
+        self.dataWorker.moveToThread(self.workerThread)
+        self.dataWorker.dataReady.connect(self.onProcessDataReady)
+        self.resumeSampling.connect(self.dataWorker.resume)
+        self.pauseSampling.connect(self.dataWorker.pause)
+        self.userActivity.connect(self.dataWorker.boost)
+        self.ramNeeded.connect(self.dataWorker.setNeedRam)
+        self.samplingInterval.connect(self.dataWorker.setBaseInterval)
+        self.workerThread.finished.connect(self.dataWorker.deleteLater)
+        self.workerThread.start()
+        QApplication.instance().aboutToQuit.connect(self.stopSampling)
+        # Minimising already hides (and so pauses) the tab; focus loss only slows sampling
+        QApplication.instance().applicationStateChanged.connect(self.onApplicationStateChanged)
+
+        self.uiUpdateTimer = QTimer(self)
+        self.uiUpdateTimer.setInterval(500)
+        self.uiUpdateTimer.timeout.connect(self.updateUI)
+        # Started in showEvent so nothing polls while another tab is in front
+
+        # Sub-tab switches redraw through this instead of waiting for the next tick;
+        # clicks landing within 50 ms of each other share one redraw
+        self._refreshTimer = QTimer(self)
+        self._refreshTimer.setSingleShot(True)
+        self._refreshTimer.setInterval(50)
+        self._refreshTimer.timeout.connect(self.updateUI)
+
+        # Sub-tab buttons carry one stylesheet for both states; the "selected" dynamic
+        # property picks the look, so switching tabs never re-parses QSS (see setSelected)
+        self.styleToggle = f"""
+            QPushButton[selected="false"] {{
+                color: #FFFFFF;
+                font-family: {sciFiFontName};
+                font-size: 26px;
+                padding: 18px;
+                background-color: transparent;
+                border: none;
+            }}
+            QPushButton[selected="false"]:hover {{
+                background-color: #333333;
+            }}
+            QPushButton[selected="true"] {{
+                color: #FFFFFF;
+                font-family: {sciFiFontName};
+                font-size: 26px;
+                padding: 18px;
+                background-color: #1A1A1A;
+                border-left: 4px solid #00A2FF;
+            }}
+        """
+        # The CPU/RAM graph buttons also get a white outline when selected
+        self.styleGraphToggle = self.styleToggle.replace(
+            "border-left: 4px solid #00A2FF;", "border: 1px solid white;\n                border-left: 4px solid #00A2FF;"
+        )
+
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(0, 0, 0, 0)
+        main_layout.setSpacing(0)
+
+        top_layout = QHBoxLayout()
+        top_layout.setContentsMargins(10, 0, 0, 0)
+        top_layout.setSpacing(0)
+
+        self.btnList = QPushButton("List")
+        self.btnGraph = QPushButton("Graph")
+        for button in (self.btnList, self.btnGraph):
+            button.setProperty("selected", False)
+            button.setStyleSheet(self.styleToggle)
+
+        # 1px separators are painted by paintEvent into these spacings rather than being QFrames
+        top_layout.addWidget(self.btnList)
+        top_layout.addSpacing(1)
+        top_layout.addWidget(self.btnGraph)
+        main_layout.addLayout(top_layout)
+        main_layout.addSpacing(1)
+        self.topLayout = top_layout
+
+        # Both views stay parented in a stack; switching is a show/hide, not a relayout
+        self.subContentLayout = QStackedLayout()
+        self.subContentLayout.setContentsMargins(0, 10, 0, 0)
+        main_layout.addLayout(self.subContentLayout)
+
+        self.listWidget = self.buildListUI()
+        self.graphWidget = self.buildGraphUI()
+        self.subContentLayout.addWidget(self.listWidget)
+        self.subContentLayout.addWidget(self.graphWidget)
+
+        self.btnList.clicked.connect(lambda: self.setCurrentSubTab(self.btnList))
+        self.btnGraph.clicked.connect(lambda: self.setCurrentSubTab(self.btnGraph))
+
+        self.setCurrentSubTab(self.btnList)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.isVisible = True
+        self.resumeSampling.emit()
+        self.uiUpdateTimer.start()
+        # Flush any sample that arrived just before we were hidden, once the show has painted
+        self._refreshTimer.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.isVisible = False
+        self.pauseSampling.emit()
+        self.uiUpdateTimer.stop()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        painter = QPainter(self)
+        top = self.topLayout.geometry()
+        # Between the List and Graph buttons, then under the whole button row
+        painter.fillRect(self.btnList.geometry().right() + 1, top.top(), 1, top.height(), Qt.white)
+        painter.fillRect(0, top.bottom() + 1, self.width(), 1, Qt.white)
+        # Under the list view's column buttons
+        if self.currentSubTab == self.btnList:
+            cols = self.colButtonsLayout.geometry()
+            origin = self.listWidget.mapTo(self, cols.bottomLeft())
+            painter.fillRect(origin.x(), origin.y() + 1, self.listWidget.width(), 1, Qt.white)
+
+    def closeEvent(self, event):
+        self.stopSampling()
+        super().closeEvent(event)
+
+    def stopSampling(self):
+        if self.workerThread.isRunning():
+            self.workerThread.quit()
+            self.workerThread.wait()
+            # The thread is stopped, so the worker's Process handles can be dropped from here
+            self.dataWorker.clearCache()
+
+    def onProcessDataReady(self, data):
+        last = self.processData
+        # A quiet tick can repeat the previous sample exactly; keep what is already on screen
+        if (last is not None and last.hasMem == data.hasMem and np.array_equal(last.pids, data.pids)
+                and np.array_equal(last.cpu, data.cpu) and np.array_equal(last.mem, data.mem)):
+            return
+        self.processData = data
+        # A sample taken before the worker saw ramNeeded(True) has no memory figures to show
+        self.updatePending = data.hasMem or not self._needRam
+
+    def updateUI(self):
+        if self.pauseUpdates or not self.isVisible or not self.updatePending:
+            return
+            
+        self.updatePending = False
+        
+        if self.currentSubTab == self.btnList:
+            self.populateTable()
+        elif self.currentSubTab == self.btnGraph:
+            if self.currentGraphSubTab == self.btnCPUGraph:
+                self.updateCPUGraph()
+            elif self.currentGraphSubTab == self.btnRAMGraph:
+                self.updateRAMGraph()
+
+    # -------------------- PART 1: The "List" Sub-Sub-Tab --------------------
+    def buildListUI(self):
+        container = QWidget()
+        # Transparent so the column separator ProcessTab paints underneath shows through
+        container.setObjectName("processList")
+        container.setStyleSheet("#processList { background: transparent; }")
+        layout = QVBoxLayout(container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+
+        colButtonsLayout = QHBoxLayout()
+        colButtonsLayout.setContentsMargins(0, 0, 0, 0)
+        colButtonsLayout.setSpacing(0)
+
+        self.btnColProcess = QPushButton("Process Name")
+        self.btnColPID = QPushButton("PID")
+        self.btnColCPU = QPushButton("CPU%")
+        self.btnColRAM = QPushButton("RAM(MB)")
+
+        self.colButtons = [ self.btnColProcess, self.btnColPID, self.btnColCPU, self.btnColRAM ]
+
+        colStyle = f"""
+            QPushButton {{
+                color: #FFFFFF;
+                font-family: {sciFiFontName};
+                font-size: 22px;
+                padding: 8px;
+                background-color: #000000;
+                border: none;
+            }}
+            QPushButton:hover {{
+                background-color: #333333;
+            }}
+            QPushButton:checked {{
+                background-color: #1A1A1A;
+                border-left: 4px solid #00A2FF;
+            }}
+        """
+
+        for b in self.colButtons:
+            b.setCheckable(True)
+            b.setStyleSheet(colStyle)
+            colButtonsLayout.addWidget(b)
+
+        layout.addLayout(colButtonsLayout)
+
+        layout.addSpacing(1)  # separator painted by ProcessTab.paintEvent
+        self.colButtonsLayout = colButtonsLayout
+
+        # The model reads straight from the snapshot arrays; no per-cell items exist
+        self.tableModel = ProcessTableModel(self)
+
+        self.table = QTableView()
+        self.table.setModel(self.tableModel)
+        self.table.horizontalHeader().hide()
+        self.table.verticalHeader().hide()
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table.setFont(QFont(sciFiFontName, 12))
+        self.table.setContextMenuPolicy(Qt.CustomContextMenu)  # Enable custom context menu
+        self.table.customContextMenuRequested.connect(self.showProcessContextMenu)  # Connect to our handler
+        layout.addWidget(self.table)
+
+        self.btnColProcess.clicked.connect(lambda: self.sortDataBy("process"))
+        self.btnColPID.clicked.connect(lambda: self.sortDataBy("pid"))
+        self.btnColCPU.clicked.connect(lambda: self.sortDataBy("cpu"))
+        self.btnColRAM.clicked.connect(lambda: self.sortDataBy("ram"))
+        self._sortBtnMap = {
+            "process": self.btnColProcess,
+            "pid": self.btnColPID,
+            "cpu": self.btnColCPU,
+            "ram": self.btnColRAM,
+        }
+
+        self.sortKey = "cpu"
+        self.btnColCPU.setChecked(True)
+
+        return container
+
+    def populateTable(self):
+        if not self.processData or not self.isVisible:
+            return
+            
+        data = self.processData
+        # Same snapshot sorted by the same column is already on screen (e.g. re-clicking a sort button)
+        if self._tableSnapshot is data and self._tableSortKey == self.sortKey:
+            return
+
+        if self.currentSubTab == self.btnList and self.isVisible:
+            self.tableModel.setSnapshot(data, self.sortKey)
+            self._tableSnapshot, self._tableSortKey = data, self.sortKey
+
+    def sortDataBy(self, key):
+        self.userActivity.emit()
+        for k, b in self._sortBtnMap.items():
+            b.setChecked(k == key)
+        self.sortKey = key
+        self.populateTable()
+
+    # -------------------- Process Control Functions --------------------
+    def showProcessContextMenu(self, position):
+        """
+        Show a sleek context menu when right-clicking on a process in the table.
+        This menu uses the Conthrax font and cool styling. Additionally, list updates
+        are paused when the menu is active or when the Ctrl key is held.
+        """
+        # Pause updates if Ctrl is held or on right-click
+        if QApplication.keyboardModifiers() & Qt.ControlModifier:
+            self.pauseUpdates = True
+        else:
+            self.pauseUpdates = True
+
+        # Get the row at the clicked position
+        index = self.table.indexAt(position)
+        if not index.isValid():
+            self.pauseUpdates = False
+            return  # No valid row clicked
+        
+        # Get the process PID from the clicked row
+        nameIndex = index.sibling(index.row(), 0)  # Process name column
+        pid = nameIndex.data(Qt.UserRole)
+        if pid is None:
+            self.pauseUpdates = False
+            return
+
+        process_name = nameIndex.data()
+        
+        # Create sleek context menu using Conthrax font and cool styling
+        menu = QMenu()
+        menu.setStyleSheet("""
+            QMenu {
+                background-color: #2B2B2B;
+                border: 1px solid #444444;
+                font-family: Conthrax;
+                font-size: 16px;
+                color: #FFFFFF;
+            }
+            QMenu::item {
+                padding: 10px 25px;
+            }
+            QMenu::item:selected {
+                background-color: #00A2FF;
+            }
+        """)
+        
+        # Add actions
+        pauseAction = menu.addAction("Pause Process")
+        resumeAction = menu.addAction("Resume Process")
+        menu.addSeparator()
+        killAction = menu.addAction("Kill Process")
+        
+        # Show menu and get selected action
+        action = menu.exec_(QCursor.pos())
+        
+        # Handle action
+        if action == pauseAction:
+            self.pauseProcess(pid, process_name)
+        elif action == resumeAction:
+            self.resumeProcess(pid, process_name)
+        elif action == killAction:
+            self.killProcess(pid, process_name)
+        
+        # Unpause updates if Ctrl is not held
+        if not (QApplication.keyboardModifiers() & Qt.ControlModifier):
+            self.pauseUpdates = False
+
+    def pauseProcess(self, pid, process_name):
+        """Pause a process by suspending it"""
+        try:
+            process = psutil.Process(pid)
+            process.suspend()
+            QMessageBox.information(self, "Process Paused", 
+                                   f"Process '{process_name}' (PID: {pid}) has been paused.")
+        except psutil.NoSuchProcess:
+            QMessageBox.warning(self, "Error", f"Process '{process_name}' (PID: {pid}) no longer exists.")
+        except psutil.AccessDenied:
+            QMessageBox.warning(self, "Access Denied", 
+                               f"Cannot pause process '{process_name}' (PID: {pid}). Access denied.")
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Error pausing process: {str(e)}")
+
+    def resumeProcess(self, pid, process_name):
+        """Resume a paused process"""
+        try:
+            process = psutil.Process(pid)
+            process.resume()
+            QMessageBox.information(self, "Process Resumed", 
+                                   f"Process '{process_name}' (PID: {pid}) has been resumed.")
+        except psutil.NoSuchProcess:
+            QMessageBox.warning(self, "Error", f"Process '{process_name}' (PID: {pid}) no longer exists.")
+        except psutil.AccessDenied:
+            QMessageBox.warning(self, "Access Denied", 
+                               f"Cannot resume process '{process_name}' (PID: {pid}). Access denied.")
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Error resuming process: {str(e)}")
+
+    def killProcess(self, pid, process_name):
+        """Kill a process"""
+        try:
+            process = psutil.Process(pid)
+            process.kill()
+            QMessageBox.information(self, "Process Killed", 
+                                   f"Process '{process_name}' (PID: {pid}) has been killed.")
+        except psutil.NoSuchProcess:
+            QMessageBox.warning(self, "Error", f"Process '{process_name}' (PID: {pid}) no longer exists.")
+        except psutil.AccessDenied:
+            QMessageBox.warning(self, "Access Denied", 
+                               f"Cannot kill process '{process_name}' (PID: {pid}). Access denied.")
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Error killing process: {str(e)}")
+
+    # -------------------- GRAPH SUB-TAB METHODS --------------------
+    def buildGraphUI(self):
+        """Builds and returns the widget for the Graph sub-tab."""
+        container = QWidget()
+        layout = QVBoxLayout(container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        
+        # Top buttons for CPU and RAM graphs
+        topButtonLayout = QHBoxLayout()
+        topButtonLayout.setContentsMargins(0, 0, 0, 0)
+        topButtonLayout.setSpacing(0)
+        
+        self.btnCPUGraph = QPushButton("CPU")
+        self.btnRAMGraph = QPushButton("RAM")
+        for button in [self.btnCPUGraph, self.btnRAMGraph]:
+            button.setCheckable(True)
+            button.setProperty("selected", False)
+            button.setStyleSheet(self.styleGraphToggle)
+        self.btnCPUGraph.setChecked(True)
+        self.setSelected(self.btnCPUGraph, True)
+        self.currentGraphSubTab = self.btnCPUGraph
+        
+        self.btnCPUGraph.clicked.connect(lambda: self.setCurrentGraphSubTab(self.btnCPUGraph))
+        self.btnRAMGraph.clicked.connect(lambda: self.setCurrentGraphSubTab(self.btnRAMGraph))
+        
+        topButtonLayout.addWidget(self.btnCPUGraph)
+        topButtonLayout.addWidget(self.btnRAMGraph)
+        layout.addLayout(topButtonLayout)
+        
+        # Graph container area
+        self.graphContainer = QWidget()
+        self.graphStack = QStackedLayout(self.graphContainer)
+        self.graphStack.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.graphContainer)
+        
+        # Instantiate graph widgets
+        self.cpuGraph = CPUBarGraphWidget()
+        self.ramGraph = RAMBarGraphWidget()
+        
+        # Both graphs live in the stack; CPU is shown first
+        self.graphStack.addWidget(self.cpuGraph)
+        self.graphStack.addWidget(self.ramGraph)
+        
+        return container
+
+    def setSelected(self, button, selected):
+        """Toggle a button's "selected" property and re-polish it against its existing stylesheet."""
+        if button.property("selected") == selected:
+            return
+        button.setProperty("selected", selected)
+        button.style().unpolish(button)
+        button.style().polish(button)
+
+    def setCurrentGraphSubTab(self, tabButton):
+        """Switch between the CPU and RAM graph views."""
+        self.userActivity.emit()
+        self.currentGraphSubTab = tabButton
+        if tabButton == self.btnCPUGraph:
+            self.btnCPUGraph.setChecked(True)
+            self.btnRAMGraph.setChecked(False)
+            self.setSelected(self.btnCPUGraph, True)
+            self.setSelected(self.btnRAMGraph, False)
+            self.graphStack.setCurrentWidget(self.cpuGraph)
+        elif tabButton == self.btnRAMGraph:
+            self.btnCPUGraph.setChecked(False)
+            self.btnRAMGraph.setChecked(True)
+            self.setSelected(self.btnCPUGraph, False)
+            self.setSelected(self.btnRAMGraph, True)
+            self.graphStack.setCurrentWidget(self.ramGraph)
+        self.syncSamplingMode()
+
+    def updateCPUGraph(self):
+        """Update CPU graph with top CPU usage processes."""
+        if not self.processData:
+            return
+        self.cpuGraph.setData(self.processData.topCpu)
+
+    def updateRAMGraph(self):
+        """Update RAM graph with top RAM usage processes."""
+        if not self.processData:
+            return
+        self.ramGraph.setData(self.processData.topMem)
+
+    # -------------------- MAIN TAB SWITCHING METHOD --------------------
+    def setCurrentSubTab(self, tabButton):
+        """Switch between the List and Graph sub-tabs."""
+        self.userActivity.emit()
+        self.currentSubTab = tabButton
+        if tabButton == self.btnList:
+            self.subContentLayout.setCurrentWidget(self.listWidget)
+            self.setSelected(self.btnList, True)
+            self.setSelected(self.btnGraph, False)
+        elif tabButton == self.btnGraph:
+            self.subContentLayout.setCurrentWidget(self.graphWidget)
+            self.setSelected(self.btnGraph, True)
+            self.setSelected(self.btnList, False)
+        self.syncSamplingMode()
+
+    def onApplicationStateChanged(self, state):
+        self._appActive = state == Qt.ApplicationActive
+        self.syncSamplingInterval()
+
+    def syncSamplingInterval(self):
+        """Base sampling rate for the current view, or the slow rate while the app is in the background."""
+        if not self._appActive:
+            interval = ProcessDataWorker.INACTIVE_INTERVAL
+        elif self.currentSubTab == self.btnList:
+            interval = ProcessDataWorker.LIST_INTERVAL
+        else:
+            interval = ProcessDataWorker.GRAPH_INTERVAL
+        if interval != self._samplingInterval:
+            self._samplingInterval = interval
+            self.samplingInterval.emit(interval)
+
+    def syncSamplingMode(self):
+        """Tell the worker what the current view needs (memory, sampling rate), and flag a redraw."""
+        needRam = self.currentSubTab == self.btnList or self.currentGraphSubTab == self.btnRAMGraph
+        if needRam != self._needRam:
+            self._needRam = needRam
+            self.ramNeeded.emit(needRam)
+        self.syncSamplingInterval()
+        # The newly shown view hasn't seen the current snapshot yet; a snapshot taken
+        # without memory waits for the sample the worker sends once RAM is needed again
+        data = self.processData
+        self.updatePending = data is not None and (data.hasMem or not needRam)
+        if self.updatePending:
+            self._refreshTimer.start()
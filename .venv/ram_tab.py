@@ -0,0 +1,202 @@
+import sys
+import psutil
+import numpy as np
+import pyqtgraph as pg
+from PyQt5.QtCore import Qt, QThread, QObject, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QFont
+from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QLabel, QGridLayout, QTableWidget, QTableWidgetItem, QHeaderView
+from monitor_clock import MonitorClock
+
+# Exact power of two, so multiplying gives the same figures as dividing by 1024 ** 3
+_BYTES_TO_GB = 1.0 / (1 << 30)
+
+# Linux fast path: graph-only ticks need just the usage %, which /proc/meminfo's first lines give
+_MEMINFO = psutil.LINUX
+
+def _readMemPercent():
+    """RAM usage % from MemTotal and MemAvailable, rounded as virtual_memory().percent is.
+
+    Returns None on kernels without MemAvailable, where psutil has to estimate it.
+    """
+    total = None
+    with open("/proc/meminfo", "rb") as f:
+        for line in f:
+            if line.startswith(b"MemTotal:"):
+                total = int(line.split()[1])
+            elif line.startswith(b"MemAvailable:"):
+                available = int(line.split()[1])
+                return round((total - available) / total * 100, 1)
+    return None
+
+class RamSampler(QObject):
+    """Reads system memory on its own thread; lives in a QThread via moveToThread."""
+    # (usage %, virtual_memory, swap_memory); the two namedtuples are None except on table ticks
+    sampled = pyqtSignal(float, object, object)
+    TABLE_TICKS = 5  # the info table is refreshed once per this many samples (10 s)
+
+    def __init__(self):
+        super().__init__()
+        self._tickCount = 0
+
+    @pyqtSlot(int)
+    def onClockTick(self, tick):
+        # Delivered queued from the GUI thread's MonitorClock, so sampling still runs here
+        self.sample()
+
+    @pyqtSlot()
+    def sample(self):
+        # The table's figures move slowly, so only every TABLE_TICKS-th sample (starting with
+        # the first) pays for the full readings; the rest only feed the usage graph
+        tableTick = self._tickCount % self.TABLE_TICKS == 0
+        self._tickCount += 1
+        if not tableTick and _MEMINFO:
+            percent = _readMemPercent()
+            if percent is not None:
+                self.sampled.emit(percent, None, None)
+                return
+        ram = psutil.virtual_memory()
+        if tableTick:
+            self.sampled.emit(ram.percent, ram, psutil.swap_memory())
+        else:
+            self.sampled.emit(ram.percent, None, None)
+
+class RamTab(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setStyleSheet("background-color: #000000; color: #FFFFFF;")
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(10)
+        
+        # Upper half: Graphs
+        graphLayout = QGridLayout()
+        graphLayout.setSpacing(10)
+        
+        # RAM Usage Graph
+        self.ramUsageLabel = QLabel("RAM Usage: 0.00%")
+        self.ramUsageLabel.setFont(QFont("Conthrax", 18, QFont.Bold))
+        self.ramUsageLabel.setAlignment(Qt.AlignCenter)
+        graphLayout.addWidget(self.ramUsageLabel, 0, 0)
+        
+        self.ramUsageGraph = pg.PlotWidget()
+        self.ramUsageGraph.setBackground("#1A1A1A")
+        self.ramUsageGraph.setTitle("RAM Usage Over Time", color="w", size="14pt")
+        self.ramUsageGraph.setLabel("left", "Usage (%)", color="w", size="12pt")
+        self.ramUsageGraph.setLabel("bottom", "Time (s)", color="w", size="12pt")
+        self.ramUsageGraph.showGrid(x=True, y=True)
+        graphLayout.addWidget(self.ramUsageGraph, 1, 0)
+        
+        self.maxHistory = 50
+        # Ring buffer of usage samples: _head is the next slot to overwrite, _filled how many are valid.
+        # The plot always shows them oldest-first at x = 0..n-1
+        self._usage = np.zeros(self.maxHistory, dtype=np.float32)
+        self._time = np.arange(self.maxHistory, dtype=np.float32)
+        self._head = 0
+        self._filled = 0
+        # Both axes are known up front (a percentage over a fixed window), so pyqtgraph needn't
+        # rescan the data for a new range on every tick
+        self.ramUsageGraph.setXRange(0, self.maxHistory - 1)
+        self.ramUsageGraph.setYRange(0, 100)
+        self.ramUsageGraph.disableAutoRange()
+        self.ramUsagePlot = self.ramUsageGraph.plot(pen=pg.mkPen(color=(0, 162, 255), width=2))
+        self.ramUsageTextItem = pg.TextItem(color=(255, 255, 255), anchor=(0.5, 0))
+        self.ramUsageGraph.addItem(self.ramUsageTextItem)
+        self._lastPctStr = ""  # text on ramUsageTextItem; TextItem re-lays out even when it's unchanged
+        
+        layout.addLayout(graphLayout, stretch=1)
+        
+        # Lower half: RAM Information Table
+        self.ramInfoTable = QTableWidget()
+        self.ramInfoTable.setColumnCount(2)
+        self.ramInfoTable.setHorizontalHeaderLabels(["Attribute", "Value"])
+        self.ramInfoTable.horizontalHeader().setStretchLastSection(True)
+        self.ramInfoTable.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.ramInfoTable.setStyleSheet("background-color: #000000; color: #FFFFFF; font-size: 16px; border: 1px solid #444;")
+        self.ramInfoTable.setFont(QFont("Conthrax", 16))
+        self.ramInfoTable.verticalHeader().setVisible(False)
+        self.ramInfoTable.setShowGrid(False)
+        layout.addWidget(self.ramInfoTable, stretch=1)
+        
+        # The rows are fixed for a platform, so their items are created once and ticks only set text
+        ram0 = psutil.virtual_memory()
+        optionalAttrs = [attr for attr in ("cached", "active", "inactive", "buffers", "shared")
+                         if hasattr(ram0, attr)]
+        # (label, reading the value comes from, field) per row
+        rows = ([("Total RAM:", "ram", "total"), ("Available RAM:", "ram", "available"),
+                 ("Used RAM:", "ram", "used"), ("Free RAM:", "ram", "free")]
+                + [(f"{attr.capitalize()} Memory:", "ram", attr) for attr in optionalAttrs]
+                + [("Swap Memory:", "swap", "total"), ("Swap Used:", "swap", "used"),
+                   ("Swap Free:", "swap", "free")])
+        labelFont = QFont("Conthrax", 16, QFont.Bold)
+        valueFont = QFont("Conthrax", 16)
+        self.ramInfoTable.setRowCount(len(rows))
+        # (value item, "ram" or "swap", field) for every row a table refresh rewrites
+        self._tableFields = []
+        for row, (label, source, attr) in enumerate(rows):
+            item1 = QTableWidgetItem(label)
+            item1.setForeground(Qt.blue)
+            item1.setFont(labelFont)
+            item2 = QTableWidgetItem()
+            item2.setForeground(Qt.white)
+            item2.setFont(valueFont)
+            self.ramInfoTable.setItem(row, 0, item1)
+            self.ramInfoTable.setItem(row, 1, item2)
+            # Installed RAM can't change while we run, so its row is filled in once here
+            if (source, attr) == ("ram", "total"):
+                item2.setText("%.2f GB" % (ram0.total * _BYTES_TO_GB))
+            else:
+                self._tableFields.append((item2, source == "swap", attr))
+        
+        # psutil reads happen on the sampler's thread; this tab only updates widgets
+        self.samplerThread = QThread(self)
+        self.sampler = RamSampler()
+        self.sampler.moveToThread(self.samplerThread)
+        self.sampler.sampled.connect(self.updateRamStats)
+        self.samplerThread.finished.connect(self.sampler.deleteLater)
+        self.samplerThread.start()
+        QApplication.instance().aboutToQuit.connect(self.stopSampling)
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        MonitorClock.instance().subscribe(self.sampler.onClockTick)
+    
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        # The sampler's thread only wakes while the graph it feeds is on screen
+        MonitorClock.instance().unsubscribe(self.sampler.onClockTick)
+    
+    def stopSampling(self):
+        MonitorClock.instance().unsubscribe(self.sampler.onClockTick)
+        if self.samplerThread.isRunning():
+            self.samplerThread.quit()
+            self.samplerThread.wait()
+    
+    def updateRamStats(self, ram_percent, ram, swap):
+        self.updateRamGraph(ram_percent)
+        if ram is not None:
+            self.updateRamTable(ram, swap)
+    
+    def updateRamGraph(self, ram_percent):
+        self.ramUsageLabel.setText(f"RAM Usage: {ram_percent:.2f}%")
+        
+        self._usage[self._head] = ram_percent
+        self._head = (self._head + 1) % self.maxHistory
+        self._filled = min(self._filled + 1, self.maxHistory)
+        if self._filled < self.maxHistory:
+            usage = self._usage[:self._filled]
+        else:
+            usage = np.concatenate((self._usage[self._head:], self._usage[:self._head]))
+        # Samples are always finite percentages, so skip pyqtgraph's NaN/inf scan
+        self.ramUsagePlot.setData(self._time[:self._filled], usage, skipFiniteCheck=True, connect="all")
+        
+        pctStr = f"{ram_percent:.2f}%"
+        if pctStr != self._lastPctStr:
+            self._lastPctStr = pctStr
+            self.ramUsageTextItem.setText(pctStr)
+        self.ramUsageTextItem.setPos(self._filled - 1, ram_percent)
+    
+    def updateRamTable(self, ram, swap):
+        # One formatted string per row straight into its item; no intermediate list
+        for item, isSwap, attr in self._tableFields:
+            item.setText("%.2f GB" % (getattr(swap if isSwap else ram, attr) * _BYTES_TO_GB))
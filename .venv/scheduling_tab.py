@@ -0,0 +1,774 @@
+import heapq
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Without numba the simulator cores below run as plain Python
+    def njit(*args, **kwargs):
+        return lambda f: f
+
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QComboBox,
+                             QTableWidget, QTableWidgetItem, QPushButton, QHeaderView, QLineEdit, QHBoxLayout, QDialog, QScrollArea)
+from PyQt5.QtCore import Qt, QRectF, QPointF, QTimer
+from PyQt5.QtGui import (QPainter, QPainterPath, QColor, QPen, QFont, QImage, QBrush,
+                         QStaticText, QTransform)
+
+# Input table columns per algorithm; any algorithm not listed uses _DEFAULT_COLUMNS
+_DEFAULT_COLUMNS = ["Process Name", "Arrival Time", "Burst Time"]
+_ALGO_COLUMNS = {
+    "Priority Scheduling": _DEFAULT_COLUMNS + ["Priority"],
+    "RMS": _DEFAULT_COLUMNS + ["Period"],
+    "EDF": _DEFAULT_COLUMNS + ["Deadline"],
+}
+# algorithm -> (show time quantum, show priority order)
+_ALGO_OPTIONS = {
+    "Round Robin": (True, False),
+    "Priority Scheduling": (False, True),
+}
+
+# Pixels a time label can reach beyond the tick or bar edge it belongs to
+_LABEL_SLACK = 40
+# Wider charts paint their background directly rather than holding an image of it
+_BG_CACHE_MAX_WIDTH = 8192
+
+@njit(cache=True)
+def _growSegments(segIdx, segStart, segEnd):
+    """The segment buffers copied into arrays twice as long (at least one slot)."""
+    size = max(1, 2 * segIdx.shape[0])
+    newIdx = np.empty(size, np.int64)
+    newStart = np.empty(size, np.float64)
+    newEnd = np.empty(size, np.float64)
+    count = segIdx.shape[0]
+    newIdx[:count] = segIdx
+    newStart[:count] = segStart
+    newEnd[:count] = segEnd
+    return newIdx, newStart, newEnd
+
+@njit(cache=True)
+def _sjf_preemptive_core(arrival, burst):
+    """Shortest Remaining Time First, advanced from event to event.
+
+    The running job can only change when a job arrives or the running one finishes,
+    so time jumps straight to the next of those. Returns (process index, start, end)
+    arrays of the execution segments in time order.
+    """
+    n = arrival.shape[0]
+    order = np.argsort(arrival, kind='mergesort')
+    # Each segment ends at a completion or an arrival
+    segIdx = np.empty(2 * n, np.int64)
+    segStart = np.empty(2 * n, np.float64)
+    segEnd = np.empty(2 * n, np.float64)
+    count = 0
+    # Ready heap of (remaining, index); ties go to the earlier table row.
+    # Seeded and emptied so numba can infer its element type.
+    ready = [(0.0, 0)]
+    ready.pop()
+    time = 0.0
+    k = 0
+    last = -1
+    while True:
+        while k < n and arrival[order[k]] <= time:
+            if burst[order[k]] > 0:
+                heapq.heappush(ready, (burst[order[k]], order[k]))
+            k += 1
+        if not ready:
+            if k == n:
+                break
+            time = arrival[order[k]]
+            continue
+        remaining, current = heapq.heappop(ready)
+        if k < n and arrival[order[k]] - time < remaining:
+            end = arrival[order[k]]
+            heapq.heappush(ready, (remaining - (end - time), current))
+        else:
+            end = time + remaining
+        if current == last and segEnd[count - 1] == time:
+            segEnd[count - 1] = end
+        else:
+            if count == segIdx.shape[0]:
+                segIdx, segStart, segEnd = _growSegments(segIdx, segStart, segEnd)
+            segIdx[count] = current
+            segStart[count] = time
+            segEnd[count] = end
+            count += 1
+        time = end
+        last = current
+    return segIdx[:count], segStart[:count], segEnd[:count]
+
+@njit(cache=True)
+def _rr_core(arrival, burst, quantum):
+    """Round Robin over processes already sorted by arrival.
+
+    Returns (process index, start, end) arrays of the execution segments in time order.
+    Repeated float subtraction can leave a sliver of a burst for one more round (a 1.0
+    burst at quantum 0.1 runs in 11 segments, the last one tiny), so the buffers grow
+    when full rather than trusting the burst / quantum estimate:
+
+    >>> _rr_core(np.array([0.0]), np.array([1.0]), 0.1)[0].size
+    11
+    """
+    n = arrival.shape[0]
+    remaining = burst.copy()
+    cap = n
+    for i in range(n):
+        if burst[i] > 0:
+            cap += int(np.ceil(burst[i] / quantum))
+    segIdx = np.empty(cap, np.int64)
+    segStart = np.empty(cap, np.float64)
+    segEnd = np.empty(cap, np.float64)
+    count = 0
+    time = 0.0
+    while True:
+        executed = False
+        for i in range(n):
+            if arrival[i] <= time and remaining[i] > 0:
+                execTime = min(quantum, remaining[i])
+                if count == segIdx.shape[0]:
+                    segIdx, segStart, segEnd = _growSegments(segIdx, segStart, segEnd)
+                segIdx[count] = i
+                segStart[count] = time
+                time += execTime
+                segEnd[count] = time
+                count += 1
+                remaining[i] -= execTime
+                executed = True
+        if not executed:
+            # Advance time to the next arrival if no process was executed.
+            nextArrival = np.inf
+            for i in range(n):
+                if remaining[i] > 0 and arrival[i] > time and arrival[i] < nextArrival:
+                    nextArrival = arrival[i]
+            if nextArrival == np.inf:
+                break
+            time = nextArrival
+    return segIdx[:count], segStart[:count], segEnd[:count]
+
+class GanttChartWidget(QWidget):
+    def __init__(self, algorithm, processSchedule, parent=None):
+        super().__init__(parent)
+        self.algorithm = algorithm
+        self.processSchedule = processSchedule
+        # The schedule is fixed once the chart is opened, so its end time is found once
+        self.maxFinish = max((p['finish'] for p in processSchedule), default=0)
+        self.scale = 10.0  # pixels per time unit zoom factor
+        self.baseWidth = 800
+        self.baseHeight = 400
+        self.setMinimumSize(self.baseWidth, self.baseHeight)
+        # Use Arial small fonts for chart drawing.
+        self.titleFont = QFont("Arial", 12, QFont.Bold)
+        self.itemFont = QFont("Arial", 10)
+        self._tickFont = QFont("Arial", 8)
+        # Pens and brushes for painting, built once rather than on every draw
+        self._black = QColor("black")
+        self._whitePen = QPen(QColor("white"))
+        self._gridPen = QPen(QColor(80, 80, 80), 1)
+        self._blueBrush = QBrush(QColor("blue"))
+        # Process names and bar time labels, laid out once as QStaticText (see staticText)
+        self._nameTexts = {}
+        self._timeTexts = {}
+        # Title, grid, time axis and row line only change with size, zoom or schedule;
+        # they are rendered once into the _bgCache QImage and blitted under the bars
+        self._bgCache = None
+        self._bgKey = None
+        # A burst of wheel steps resizes and repaints once, from the next event loop pass
+        self._updateScheduled = False
+        
+    def paintEvent(self, event):
+        # Nothing of the chart is on screen (window minimized or scrolled out of view)
+        if self.visibleRegion().isEmpty():
+            return
+        
+        # Only what intersects the exposed area is drawn; scrolling the chart exposes thin strips
+        dirty = event.rect()
+        
+        # Define margins.
+        left_margin = 50
+        bottom_margin = 50  # leave space for time axis at bottom.
+        top_margin = 20
+        right_margin = 50
+        
+        # Determine the drawing area for the chart.
+        chart_area = self.rect().adjusted(left_margin, top_margin + 30, -right_margin, -bottom_margin)
+        
+        maxFinish = self.maxFinish
+        
+        # Calculate total width needed for the chart
+        total_width = left_margin + maxFinish * self.scale + right_margin
+        
+        # Adjust widget size based on scale and content
+        if total_width > self.width():
+            self.setMinimumWidth(int(total_width))
+        
+        # Determine appropriate time label interval based on zoom level
+        # When zoomed out, show fewer labels to prevent crowding
+        if self.scale < 5:
+            time_interval = 10
+        elif self.scale < 10:
+            time_interval = 5
+        elif self.scale < 20:
+            time_interval = 2
+        else:
+            time_interval = 1
+        
+        painter = QPainter(self)
+        if self.width() <= _BG_CACHE_MAX_WIDTH:
+            dpr = self.devicePixelRatioF()
+            key = (self.width(), self.height(), dpr, self.scale, len(self.processSchedule), maxFinish)
+            if key != self._bgKey:
+                # Premultiplied ARGB32 is the raster engine's native format, so blits need no conversion
+                self._bgCache = QImage(self.size() * dpr, QImage.Format_ARGB32_Premultiplied)
+                self._bgCache.setDevicePixelRatio(dpr)
+                bgPainter = QPainter(self._bgCache)
+                self.paintBackground(bgPainter, self.rect(), chart_area, maxFinish, time_interval)
+                bgPainter.end()
+                self._bgKey = key
+            painter.drawImage(0, 0, self._bgCache)
+        else:
+            self.paintBackground(painter, dirty, chart_area, maxFinish, time_interval)
+        
+        # The process row sits near the bottom of the chart area, just above the time labels
+        rowHeight = 30
+        y = chart_area.bottom() - rowHeight - 10
+        
+        # Sort processes by start time to ensure they appear in chronological order
+        sorted_processes = sorted(self.processSchedule, key=lambda proc: proc['start'])
+        
+        # Keep track of which time points have already been displayed to avoid duplicates
+        displayed_times = set()
+        
+        # Bars are collected into one path, then filled and outlined with a single call each;
+        # names and time labels are drawn afterwards, one font at a time
+        bars = QPainterPath()
+        names = []
+        timeLabels = []
+        painter.setFont(self._tickFont)
+        for proc in sorted_processes:
+            start = proc['start']
+            finish = proc['finish']
+            rect_x = left_margin + start * self.scale
+            rect_width = (finish - start) * self.scale
+            # y-coordinate is fixed for all processes (near bottom of chart area)
+            rect_y = y - rowHeight/2
+            rect = QRectF(rect_x, rect_y, rect_width, rowHeight)
+            # The bar plus the time labels above it; outside the exposed area nothing is drawn,
+            # but the labels are still recorded so later bars dedupe them as a full paint would
+            visible = dirty.intersects(rect.adjusted(-_LABEL_SLACK, -_LABEL_SLACK,
+                                                     _LABEL_SLACK, 0).toAlignedRect())
+            if visible:
+                bars.addRect(rect)
+                names.append((rect, proc['name']))
+            
+            # Start and finish times go just above the rectangle
+            # Use the same interval logic as the bottom time labels
+            
+            # Only show start time if it falls on an interval boundary or it's the first process
+            # AND it hasn't been displayed yet
+            start_str = str(start)
+            if (int(start) % time_interval == 0 or proc == sorted_processes[0]) and start_str not in displayed_times:
+                # Position start time at the left edge of the process
+                if visible:
+                    timeLabels.append((int(rect_x), int(rect_y - 5), start_str))
+                displayed_times.add(start_str)
+            
+            # Only show finish time if it falls on an interval boundary or it's the last process
+            # AND it hasn't been displayed yet
+            finish_str = str(finish)
+            if (int(finish) % time_interval == 0 or proc == sorted_processes[-1]) and finish_str not in displayed_times:
+                if visible:
+                    # Position finish time at the right edge of the process, with better spacing
+                    # Calculate text width to ensure it doesn't overlap with other labels
+                    text_width = painter.fontMetrics().width(finish_str)
+                    # Position the finish time at the right edge of the process rectangle
+                    # Ensure it's fully visible by subtracting the text width
+                    timeLabels.append((int(rect_x + rect_width - text_width), int(rect_y - 5), finish_str))
+                displayed_times.add(finish_str)
+        
+        painter.fillPath(bars, self._blueBrush)
+        painter.strokePath(bars, self._whitePen)
+        
+        # Draw process names inside the rectangles in white using Arial.
+        painter.setPen(self._whitePen)
+        painter.setFont(self.itemFont)
+        for rect, name in names:
+            text = self.staticText(self._nameTexts, name, self.itemFont)
+            size = text.size()
+            pos = rect.center() - QPointF(size.width() / 2, size.height() / 2)
+            if size.width() > rect.width():
+                # Too wide for its bar: clip to the bar as drawText(rect, ...) does
+                painter.setClipRect(rect)
+                painter.drawStaticText(pos, text)
+                painter.setClipping(False)
+            else:
+                painter.drawStaticText(pos, text)
+        painter.setFont(self._tickFont)
+        # Labels are positioned by baseline; static text is drawn from its top-left corner
+        ascent = painter.fontMetrics().ascent()
+        for x, y, label in timeLabels:
+            painter.drawStaticText(x, y - ascent, self.staticText(self._timeTexts, label, self._tickFont))
+            
+        painter.end()
+        
+    def staticText(self, cache, text, font):
+        """The QStaticText for text in font, prepared on first use and kept in cache."""
+        staticText = cache.get(text)
+        if staticText is None:
+            staticText = QStaticText(text)
+            staticText.setTextFormat(Qt.PlainText)
+            staticText.prepare(QTransform(), font)
+            cache[text] = staticText
+        return staticText
+        
+    def paintBackground(self, painter, dirty, chart_area, maxFinish, time_interval):
+        """Everything under the bars: black fill, title, time grid and labels, and the row line.
+        
+        Drawn without antialiasing: every line here is axis-aligned on whole pixels.
+        """
+        left_margin = chart_area.left()
+        top_margin = 20
+        
+        # Fill entire widget with black.
+        painter.fillRect(self.rect(), self._black)
+        
+        # Draw chart title at the top-left (in white, using Arial).
+        painter.setPen(self._whitePen)
+        painter.setFont(self.titleFont)
+        painter.drawText(10, top_margin + 15, f"Gantt Chart - {self.algorithm}")
+        
+        # Fill chart area with black.
+        painter.fillRect(chart_area, self._black)
+        
+        # Draw dynamic grid lines on chart area
+        painter.setPen(self._gridPen)  # dark gray grid lines
+        
+        # Draw vertical grid lines for each time unit based on interval, limited to the
+        # exposed columns (widened by a label's width, since labels overhang their tick)
+        t_min = max(0, int((dirty.left() - _LABEL_SLACK - left_margin) / self.scale))
+        t_max = min(int(maxFinish), int((dirty.right() + _LABEL_SLACK - left_margin) / self.scale) + 1)
+        for t in range(t_min, t_max + 1):
+            x = left_margin + t * self.scale
+            # Draw grid line spanning chart area
+            painter.drawLine(int(x), int(chart_area.top()), int(x), int(chart_area.bottom()))
+            
+            # Draw time labels at the bottom, but only at appropriate intervals
+            if t % time_interval == 0:
+                painter.setFont(self._tickFont)
+                painter.setPen(self._whitePen)
+                painter.drawText(int(x) - 5, self.height() - 15, str(t))
+                painter.setPen(self._gridPen)
+        
+        # Draw a single horizontal line for the process row
+        # Position it near the bottom of the chart area, just above the time labels
+        rowHeight = 30
+        y = chart_area.bottom() - rowHeight - 10  # Position above time labels
+        painter.drawLine(int(chart_area.left()), int(y + rowHeight/2), int(chart_area.right()), int(y + rowHeight/2))
+        
+    def wheelEvent(self, event):
+        # Use mouse wheel events to modify scale (zoom in/out)
+        delta = event.angleDelta().y() / 120
+        factor = 1.1
+        if delta > 0:
+            self.scale *= factor**delta
+        else:
+            self.scale /= factor**(-delta)
+        self.scale = max(1.0, min(self.scale, 50))
+        
+        if not self._updateScheduled:
+            self._updateScheduled = True
+            QTimer.singleShot(0, self._doUpdate)
+    
+    def _doUpdate(self):
+        self._updateScheduled = False
+        # Adjust widget size based on new scale
+        self.updateSize()
+        if self.isVisible():
+            self.update()
+    
+    def updateSize(self):
+        # Calculate required width based on scale
+        required_width = 50 + self.maxFinish * self.scale + 50  # left_margin + content + right_margin
+        
+        # Set minimum width to ensure all content is visible
+        self.setMinimumWidth(max(self.baseWidth, int(required_width)))
+
+class GanttChartWindow(QDialog):
+    def __init__(self, algorithm, processSchedule, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Gantt Chart")
+        self.algorithm = algorithm
+        self.processSchedule = processSchedule
+        self.setStyleSheet("background-color: black;")
+        
+        # Create a scroll area for the dynamic GanttChartWidget
+        scrollArea = QScrollArea(self)
+        scrollArea.setWidgetResizable(True)
+        scrollArea.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        scrollArea.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        
+        self.chartWidget = GanttChartWidget(algorithm, processSchedule)
+        scrollArea.setWidget(self.chartWidget)
+        
+        # Update chart widget size based on initial scale
+        self.chartWidget.updateSize()
+        
+        layout = QVBoxLayout(self)
+        layout.addWidget(scrollArea)
+        
+        # Set a larger initial size for the window
+        self.resize(1200, 600)
+        
+class SchedulingTab(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Set font Conthrax everywhere using style sheet
+        self.setStyleSheet("background-color: #000000; color: #FFFFFF; font-family: Conthrax;")
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(10)
+        layout.setAlignment(Qt.AlignTop)  # Ensure everything is at the top
+        
+        # Heading styled like the main window's menu header:
+        heading = QLabel("Scheduling Algorithms")
+        heading.setStyleSheet("color: white; font-size: 68px; padding: 10px; font-family: Conthrax; font-weight: bold;")
+        heading.setAlignment(Qt.AlignLeft)
+        layout.addWidget(heading)
+        
+        # Add a label for the combobox
+        algoLabel = QLabel("Algorithm:")
+        algoLabel.setStyleSheet("color: white; font-size: 30px; padding-left: 10px; font-family: Conthrax;")
+        algoLabel.setAlignment(Qt.AlignLeft)
+        layout.addWidget(algoLabel)
+        
+        # Dropdown to select scheduling algorithm, positioned immediately below the label.
+        self.schedAlgoCombo = QComboBox()
+        self.schedAlgoCombo.setStyleSheet("background-color: #000000; color: white; font-size: 30px; font-family: Conthrax;")
+        # Set the default prompt text
+        self.schedAlgoCombo.addItem("Select Algorithm")
+        self.schedAlgoCombo.addItems([
+            "FCFS",
+            "SJF (Non Preemptive)",
+            "SJF (Preemptive)",
+            "Priority Scheduling",
+            "RMS",
+            "EDF",
+            "Round Robin"
+        ])
+        # Disable the default prompt option.
+        self.schedAlgoCombo.model().item(0).setEnabled(False)
+        layout.addWidget(self.schedAlgoCombo, alignment=Qt.AlignLeft)
+        
+        # Additional Options Container (for time quantum / priority order)
+        self.additionalOptionsContainer = QWidget()
+        additionalLayout = QVBoxLayout(self.additionalOptionsContainer)
+        additionalLayout.setContentsMargins(0, 0, 0, 0)
+        additionalLayout.setSpacing(5)
+        
+        # Time Quantum (for Round Robin)
+        self.timeQuantumContainer = QWidget()
+        tqLayout = QHBoxLayout(self.timeQuantumContainer)
+        tqLayout.setContentsMargins(0, 0, 0, 0)
+        tqLayout.setSpacing(5)
+        tqLabel = QLabel("Time Quantum:")
+        tqLabel.setStyleSheet("color: white; font-size: 28px; font-family: Conthrax;")
+        self.timeQuantumEdit = QLineEdit()
+        self.timeQuantumEdit.setStyleSheet("background-color: #3A3A3A; color: white; font-size: 28px; font-family: Conthrax;")
+        tqLayout.addWidget(tqLabel)
+        tqLayout.addWidget(self.timeQuantumEdit)
+        self.timeQuantumContainer.hide()  # Hide by default
+        additionalLayout.addWidget(self.timeQuantumContainer, alignment=Qt.AlignLeft)
+        
+        # Priority Order (for Priority Scheduling)
+        self.priorityOrderContainer = QWidget()
+        poLayout = QHBoxLayout(self.priorityOrderContainer)
+        poLayout.setContentsMargins(0, 0, 0, 0)
+        poLayout.setSpacing(5)
+        poLabel = QLabel("Priority Order:")
+        poLabel.setStyleSheet("color: white; font-size: 28px; font-family: Conthrax;")
+        self.priorityOrderCombo = QComboBox()
+        self.priorityOrderCombo.setStyleSheet("background-color: #000000; color: white; font-size: 28px; font-family: Conthrax;")
+        self.priorityOrderCombo.addItems(["Greater Priority First", "Smaller Priority First"])
+        poLayout.addWidget(poLabel)
+        poLayout.addWidget(self.priorityOrderCombo)
+        self.priorityOrderContainer.hide()  # Hide by default
+        additionalLayout.addWidget(self.priorityOrderContainer, alignment=Qt.AlignLeft)
+        
+        layout.addWidget(self.additionalOptionsContainer)
+        
+        # Process Input Form Container
+        self.processFormContainer = QWidget()
+        self.processFormLayout = QVBoxLayout(self.processFormContainer)
+        self.processFormLayout.setContentsMargins(0, 0, 0, 0)
+        self.processFormLayout.setSpacing(10)
+        
+        # Table widget for process inputs
+        self.processTable = QTableWidget()
+        self.processTable.setStyleSheet(
+            "QTableWidget { background-color: #000000; color: white; font-size: 16px; font-family: Conthrax; gridline-color: white; }"
+            "QHeaderView::section { background-color: #000000; color: white; font-family: Conthrax; font-weight: bold; border: 1px solid white; }"
+            "QTableWidget::item { border: 1px solid white; }"
+            "QTableWidget::item:selected { background-color: blue; }"
+        )
+        self.processTable.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.processTable.verticalHeader().setStyleSheet("background-color: #000000; color: white; font-family: Conthrax;")
+        self.processTable.setFixedHeight(600)
+        
+        self.processFormLayout.addWidget(self.processTable)
+        
+        # Button Container for "Add Process", "Clear Table", "Remove Process", and "Start Scheduling"
+        buttonContainer = QWidget()
+        buttonLayout = QHBoxLayout(buttonContainer)
+        buttonLayout.setContentsMargins(0, 0, 0, 0)
+        buttonLayout.setSpacing(10)
+        
+        # Add Process button
+        self.addProcessButton = QPushButton("Add Process")
+        self.addProcessButton.setStyleSheet("background-color: #3A3A3A; color: white; font-size: 30px; font-family: Conthrax;")
+        self.addProcessButton.clicked.connect(self.addProcessRow)
+        buttonLayout.addWidget(self.addProcessButton, alignment=Qt.AlignLeft)
+        
+        # Clear Table button
+        self.clearTableButton = QPushButton("Clear Table")
+        self.clearTableButton.setStyleSheet("background-color: #3A3A3A; color: white; font-size: 30px; font-family: Conthrax;")
+        self.clearTableButton.clicked.connect(self.clearTable)
+        buttonLayout.addWidget(self.clearTableButton, alignment=Qt.AlignLeft)
+        
+        # Remove Process button
+        self.removeProcessButton = QPushButton("Remove Process")
+        self.removeProcessButton.setStyleSheet("background-color: #3A3A3A; color: white; font-size: 30px; font-family: Conthrax;")
+        self.removeProcessButton.clicked.connect(self.removeProcess)
+        buttonLayout.addWidget(self.removeProcessButton, alignment=Qt.AlignLeft)
+        
+        # Start Scheduling button
+        self.startSchedulingButton = QPushButton("Start Scheduling")
+        self.startSchedulingButton.setStyleSheet("background-color: #3A3A3A; color: white; font-size: 30px; font-family: Conthrax;")
+        self.startSchedulingButton.clicked.connect(self.startScheduling)
+        buttonLayout.addWidget(self.startSchedulingButton, alignment=Qt.AlignLeft)
+        
+        self.processFormLayout.addWidget(buttonContainer)
+        
+        layout.addWidget(self.processFormContainer)
+        
+        # Set up the process input form based on the current algorithm.
+        self.updateProcessInputForm(self.schedAlgoCombo.currentText())
+        
+        # Connect the combobox selection change; the entries never change, so the new
+        # index is mapped to its algorithm name without asking the combo's model
+        self._algoNames = tuple(self.schedAlgoCombo.itemText(i) for i in range(self.schedAlgoCombo.count()))
+        self.schedAlgoCombo.currentIndexChanged[int].connect(self.onAlgoIndexChanged)
+        
+        # Keep a counter for default process names.
+        self.processCount = 0
+
+    def onAlgoIndexChanged(self, index):
+        self.updateProcessInputForm(self._algoNames[index])
+
+    def updateProcessInputForm(self, algo):
+        """
+        Update the process input form based on the selected scheduling algorithm.
+        """
+        columns = _ALGO_COLUMNS.get(algo, _DEFAULT_COLUMNS)
+        
+        # Rebuild the headers and rows behind one repaint
+        self.processTable.setUpdatesEnabled(False)
+        self.processTable.clear()
+        self.processTable.setColumnCount(len(columns))
+        self.processTable.setHorizontalHeaderLabels(columns)
+        self.processTable.setRowCount(0)
+        self.processTable.setUpdatesEnabled(True)
+        self.processCount = 0
+        
+        self.updateAdditionalOptionsVisibility(algo)
+
+    def updateAdditionalOptionsVisibility(self, algo):
+        showQuantum, showPriorityOrder = _ALGO_OPTIONS.get(algo, (False, False))
+        self.timeQuantumContainer.setVisible(showQuantum)
+        self.priorityOrderContainer.setVisible(showPriorityOrder)
+        
+    def addProcessRow(self):
+        self.addProcessRows(1)
+    
+    def addProcessRows(self, count):
+        """Append count rows of default values; the table repaints once at the end."""
+        table = self.processTable
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            colCount = table.columnCount()
+            firstRow = table.rowCount()
+            # One row-count change for the whole batch instead of an insertRow per row
+            table.setRowCount(firstRow + count)
+            for currentRow in range(firstRow, firstRow + count):
+                self.processCount += 1
+                defaultName = f"p{self.processCount}"
+                for col in range(colCount):
+                    if col == 0:
+                        item = QTableWidgetItem(defaultName)
+                    else:
+                        item = QTableWidgetItem("0")
+                    table.setItem(currentRow, col, item)
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+            table.viewport().update()
+    
+    def clearTable(self):
+        self.processTable.setRowCount(0)
+        self.processCount = 0
+        
+    def removeProcess(self):
+        selected = self.processTable.selectedIndexes()
+        if not selected:
+            return
+        row_to_remove = selected[0].row()
+        self.processTable.removeRow(row_to_remove)
+    
+    
+    
+    def startScheduling(self):
+        """
+        When Start Scheduling is clicked, gather table data and compute a schedule
+        based on the selected algorithm.
+        Implementations provided for:
+        - FCFS
+        - SJF (Non Preemptive)
+        - SJF (Preemptive) without context switch delay
+        - Priority Scheduling (non-preemptive)
+        - RMS (non-preemptive)
+        - EDF (non-preemptive)
+        - Round Robin without extra context switch seconds
+        """
+        # Determine selected algorithm.
+        alg = self.schedAlgoCombo.currentText()
+
+        # Gather process data from the table. Arrival and burst times are parsed straight
+        # into arrays, which the simulator cores take as they are.
+        table = self.processTable
+        rows = table.rowCount()
+
+        def cellValue(r, c):
+            item = table.item(r, c)
+            return float(item.text()) if item else 0.0
+
+        names = [table.item(r, 0).text() if table.item(r, 0) else f"p{r+1}" for r in range(rows)]
+        arrival = np.fromiter((cellValue(r, 1) for r in range(rows)), dtype=np.float64, count=rows)
+        burst = np.fromiter((cellValue(r, 2) for r in range(rows)), dtype=np.float64, count=rows)
+        processList = [{'name': name, 'arrival': a, 'burst': b}
+                       for name, a, b in zip(names, arrival.tolist(), burst.tolist())]
+        # For algorithms that require extra info, get the fourth column.
+        extraField = {"Priority Scheduling": 'priority', "RMS": 'period', "EDF": 'deadline'}.get(alg)
+        if table.columnCount() >= 4 and extraField:
+            for r, proc in enumerate(processList):
+                cell = table.item(r, 3)
+                try:
+                    value = float(cell.text()) if cell else (proc['arrival'] + proc['burst'])
+                except Exception:
+                    value = proc['arrival'] + proc['burst']
+                proc[extraField] = value
+
+        # Note: No context switch overhead is added (i.e. switching is instantaneous).
+
+        def non_preemptive_schedule(plist, key):
+            # Runs each job to completion, always picking the arrived job with the smallest
+            # key. Arrived jobs wait in a (key, index) heap, so ties go to the earlier table row.
+            arrivals = [(p['arrival'], i) for i, p in enumerate(plist)]
+            heapq.heapify(arrivals)
+            ready = []
+            sched = []
+            currentTime = 0.0
+            while arrivals or ready:
+                if not ready and arrivals[0][0] > currentTime:
+                    currentTime = arrivals[0][0]
+                while arrivals and arrivals[0][0] <= currentTime:
+                    i = heapq.heappop(arrivals)[1]
+                    heapq.heappush(ready, (key[i], i))
+                chosen = plist[heapq.heappop(ready)[1]]
+                start = max(currentTime, chosen['arrival'])
+                finish = start + chosen['burst']
+                sched.append({'name': chosen['name'], 'arrival': chosen['arrival'], 'burst': chosen['burst'],
+                            'start': start, 'finish': finish})
+                currentTime = finish
+            return sched
+
+        # Helper scheduling functions.
+        def fcfs_schedule(plist):
+            plist_sorted = sorted(plist, key=lambda p: p['arrival'])
+            currentTime = 0.0
+            sched = []
+            for p in plist_sorted:
+                start = max(currentTime, p['arrival'])
+                finish = start + p['burst']
+                sched.append({'name': p['name'], 'arrival': p['arrival'], 'burst': p['burst'],
+                            'start': start, 'finish': finish})
+                currentTime = finish
+            return sched
+
+        def sjf_non_preemptive_schedule(plist):
+            return non_preemptive_schedule(plist, [p['burst'] for p in plist])
+
+        def segments_schedule(plist, segIdx, segStart, segEnd):
+            # Maps the cores' index/start/end arrays back to schedule entries
+            sched = []
+            for i, start, finish in zip(segIdx.tolist(), segStart.tolist(), segEnd.tolist()):
+                p = plist[i]
+                sched.append({'name': p['name'], 'arrival': p['arrival'], 'burst': p['burst'],
+                            'start': start, 'finish': finish})
+            return sched
+
+        def sjf_preemptive_schedule(plist):
+            # Shortest Remaining Time First without context switch delay.
+            return segments_schedule(plist, *_sjf_preemptive_core(arrival, burst))
+
+        def round_robin_schedule(plist, quantum):
+            # Round Robin without context switch delay.
+            order = np.argsort(arrival, kind='stable')
+            plist_sorted = [plist[i] for i in order.tolist()]
+            return segments_schedule(plist_sorted, *_rr_core(arrival[order], burst[order], float(quantum)))
+
+        def priority_schedule(plist, order="Smaller Priority First"):
+            if order == "Smaller Priority First":
+                priority = [p.get('priority', 9999) for p in plist]
+            else:
+                # Negated so the highest priority is the minimum; ties still go to the earlier row
+                priority = [-p.get('priority', -9999) for p in plist]
+            return non_preemptive_schedule(plist, priority)
+
+        def rms_schedule(plist):
+            for p in plist:
+                if 'period' not in p:
+                    p['period'] = p['arrival'] + p['burst']
+            return non_preemptive_schedule(plist, [p['period'] for p in plist])
+
+        def edf_schedule(plist):
+            for p in plist:
+                if 'deadline' not in p:
+                    p['deadline'] = p['arrival'] + p['burst']
+            return non_preemptive_schedule(plist, [p['deadline'] for p in plist])
+
+        # Choose scheduler based on algorithm.
+        if alg == "FCFS":
+            schedule = fcfs_schedule(processList)
+        elif alg == "SJF (Non Preemptive)":
+            schedule = sjf_non_preemptive_schedule(processList)
+        elif alg == "SJF (Preemptive)":
+            schedule = sjf_preemptive_schedule(processList)
+        elif alg == "Priority Scheduling":
+            order = self.priorityOrderCombo.currentText() if self.priorityOrderCombo.currentText() in ["Greater Priority First", "Smaller Priority First"] else "Smaller Priority First"
+            schedule = priority_schedule(processList, order)
+        elif alg == "RMS":
+            schedule = rms_schedule(processList)
+        elif alg == "EDF":
+            schedule = edf_schedule(processList)
+        elif alg == "Round Robin":
+            try:
+                quantum = float(self.timeQuantumEdit.text())
+                if quantum <= 0:
+                    quantum = 1.0
+            except Exception:
+                quantum = 1.0
+            schedule = round_robin_schedule(processList, quantum)
+        else:
+            schedule = fcfs_schedule(processList)
+        # Open the Gantt Chart window with the computed schedule.
+        ganttWindow = GanttChartWindow(alg, schedule, self)
+        ganttWindow.exec_()
\ No newline at end of file